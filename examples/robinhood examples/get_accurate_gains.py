@@ -21,26 +21,22 @@ profileData = r.load_portfolio_profile()
 allTransactions = r.get_bank_transfers()
 cardTransactions = r.get_card_transactions()
 
-deposits = sum(
-    float(x["amount"])
-    for x in allTransactions
-    if (x["direction"] == "deposit") and (x["state"] == "completed")
-)
-withdrawals = sum(
-    float(x["amount"])
-    for x in allTransactions
-    if (x["direction"] == "withdraw") and (x["state"] == "completed")
-)
+# Total up the completed transfers in a single pass over the transactions.
+deposits = withdrawals = reversal_fees = 0.0
+for x in allTransactions:
+    if x["direction"] == "deposit":
+        if x["state"] == "completed":
+            deposits += float(x["amount"])
+        elif x["state"] == "reversed":
+            reversal_fees += float(x["fees"])
+    elif x["direction"] == "withdraw" and x["state"] == "completed":
+        withdrawals += float(x["amount"])
+
 debits = sum(
     float(x["amount"]["amount"])
     for x in cardTransactions
     if (x["direction"] == "debit" and (x["transaction_type"] == "settled"))
 )
-reversal_fees = sum(
-    float(x["fees"])
-    for x in allTransactions
-    if (x["direction"] == "deposit") and (x["state"] == "reversed")
-)
 
 money_invested = deposits + reversal_fees - (withdrawals - debits)
 dividends = r.get_total_dividends()
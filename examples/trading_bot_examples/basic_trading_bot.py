@@ -14,12 +14,24 @@ Usage:
 Make sure to configure your .env file first!
 """
 
+import asyncio
+import atexit
+import csv
+import json
 import logging
 import os
+import queue
+import threading
 import time
-from typing import Optional
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
+from datetime import date
+from logging.handlers import QueueHandler, QueueListener
+from operator import itemgetter
+from typing import Literal, Optional
 
 from dotenv import load_dotenv
+from trading_utils import RollingMA, TokenBucket
 
 import robin_stocks.gemini as gem
 import robin_stocks.robinhood as rh
@@ -28,121 +40,360 @@ import robin_stocks.tda as tda
 # Load environment variables
 load_dotenv()
 
-# Configure logging
+# Configure logging. Records are put on a queue and written to the file and
+# console by a background listener thread, so logging never blocks trading.
+_log_queue = queue.Queue(-1)
+_log_formatter = logging.Formatter(
+    "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+)
+_log_handlers = [
+    logging.FileHandler(os.getenv("log_file", "trading_bot.log")),
+    logging.StreamHandler(),
+]
+for _handler in _log_handlers:
+    _handler.setFormatter(_log_formatter)
+log_listener = QueueListener(_log_queue, *_log_handlers)
+log_listener.start()
+atexit.register(log_listener.stop)
+
 logging.basicConfig(
     level=getattr(logging, os.getenv("log_level", "INFO")),
-    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-    handlers=[
-        logging.FileHandler(os.getenv("log_file", "trading_bot.log")),
-        logging.StreamHandler(),
-    ],
+    format="%(message)s",
+    handlers=[QueueHandler(_log_queue)],
 )
 logger = logging.getLogger(__name__)
 
+_close_price = itemgetter("close_price")
+
+
+def _appended_closes(old: list, new: list) -> Optional[list[float]]:
+    """
+    Get the closes of the bars in ``new`` that follow the last bar of ``old``.
+
+    Returns:
+        list: Closes of the appended bars, oldest first, or None if ``new``
+        does not continue ``old`` with its last bar unchanged
+    """
+    last = old[-1]
+    begins_at = last.get("begins_at")
+    if begins_at is None:
+        return None
+    for i in range(len(new) - 1, -1, -1):
+        if new[i].get("begins_at") == begins_at:
+            if new[i].get("close_price") != last.get("close_price"):
+                return None
+            return [float(_close_price(bar)) for bar in new[i + 1 :]]
+    return None
+
+
+@dataclass(frozen=True)
+class BotConfig:
+    """Bot settings, read once from the environment."""
+
+    dry_run: bool
+    max_position_size: float
+    daily_loss_limit: float
+    default_stop_loss: float
+    default_take_profit: float
+    api_rate_limit: float
+    api_burst: int
+    max_workers: int
+    stock_symbols: tuple[str, ...]
+    crypto_symbols: tuple[str, ...]
+    monitor_crypto: bool
+    short_ma_period: int
+    long_ma_period: int
+    historicals_cache_ttl: float
+    historicals_cache_dir: str
+    price_refresh_interval: float
+    max_quote_age: float
+    portfolio_cache_ttl: float
+    state_file: str
+    positions_reconcile_cycles: int
+    robin_username: Optional[str]
+    robin_password: Optional[str]
+    robin_mfa: Optional[str]
+    gemini_account_key: Optional[str]
+    gemini_account_secret: Optional[str]
+    gemini_sandbox: bool
+    tda_encryption_passcode: Optional[str]
+
+    @classmethod
+    def from_env(cls) -> "BotConfig":
+        """Build the configuration from environment variables."""
+        return cls(
+            dry_run=os.getenv("dry_run_mode", "true").lower() == "true",
+            max_position_size=float(os.getenv("max_position_size", "0.05")),
+            daily_loss_limit=float(os.getenv("daily_loss_limit", "0.02")),
+            default_stop_loss=float(os.getenv("default_stop_loss", "0.02")),
+            default_take_profit=float(os.getenv("default_take_profit", "0.05")),
+            api_rate_limit=float(os.getenv("api_rate_limit", "5.0")),
+            api_burst=int(os.getenv("api_burst", "10")),
+            max_workers=int(os.getenv("max_workers", "4")),
+            stock_symbols=tuple(os.getenv("stock_symbols", "AAPL,TSLA,SPY").split(",")),
+            crypto_symbols=tuple(
+                os.getenv("crypto_symbols", "btcusd,ethusd").split(",")
+            ),
+            monitor_crypto=os.getenv("monitor_crypto", "false").lower() == "true",
+            short_ma_period=int(os.getenv("short_ma_period", "10")),
+            long_ma_period=int(os.getenv("long_ma_period", "20")),
+            historicals_cache_ttl=float(os.getenv("historicals_cache_ttl", "14400")),
+            historicals_cache_dir=os.path.expanduser(
+                os.getenv("historicals_cache_dir", "~/.cache/robin_stocks")
+            ),
+            price_refresh_interval=float(os.getenv("price_refresh_interval", "5.0")),
+            max_quote_age=float(os.getenv("max_quote_age", "15.0")),
+            portfolio_cache_ttl=float(os.getenv("portfolio_cache_ttl", "30")),
+            state_file=os.getenv("state_file", "trading_bot_state.json"),
+            positions_reconcile_cycles=int(
+                os.getenv("positions_reconcile_cycles", "10")
+            ),
+            robin_username=os.getenv("robin_username"),
+            robin_password=os.getenv("robin_password"),
+            robin_mfa=os.getenv("robin_mfa"),
+            gemini_account_key=os.getenv("gemini_account_key"),
+            gemini_account_secret=os.getenv("gemini_account_secret"),
+            gemini_sandbox=os.getenv("gemini_sandbox", "true").lower() == "true",
+            tda_encryption_passcode=os.getenv("tda_encryption_passcode"),
+        )
+
 
 class BasicTradingBot:
     """
     A basic trading bot with risk management and multi-API support.
     """
 
-    def __init__(self):
-        """Initialize the trading bot with configuration from environment."""
-        self.dry_run = os.getenv("dry_run_mode", "true").lower() == "true"
-        self.max_position_size = float(os.getenv("max_position_size", "0.05"))
-        self.daily_loss_limit = float(os.getenv("daily_loss_limit", "0.02"))
-        self.default_stop_loss = float(os.getenv("default_stop_loss", "0.02"))
-        self.default_take_profit = float(os.getenv("default_take_profit", "0.05"))
-        self.api_delay = float(os.getenv("api_delay", "1.0"))
+    def __init__(self, config: Optional[BotConfig] = None):
+        """
+        Initialize the trading bot.
 
+        Args:
+            config: Bot settings, read from the environment if not given
+        """
+        self.config = config or BotConfig.from_env()
+        self.dry_run = self.config.dry_run
+        self.max_position_size = self.config.max_position_size
+        self.daily_loss_limit = self.config.daily_loss_limit
+        self.default_stop_loss = self.config.default_stop_loss
+        self.default_take_profit = self.config.default_take_profit
+        self.api_rate_limit = self.config.api_rate_limit
+        self.api_burst = self.config.api_burst
+        self.max_workers = self.config.max_workers
         # Trading symbols
-        self.stock_symbols = os.getenv("stock_symbols", "AAPL,TSLA,SPY").split(",")
-        self.crypto_symbols = os.getenv("crypto_symbols", "btcusd,ethusd").split(",")
+        self.stock_symbols = self.config.stock_symbols
+        self.crypto_symbols = self.config.crypto_symbols
+        # The crypto leg only logs prices, so it runs only when asked for
+        self.monitor_crypto = self.config.monitor_crypto
+
+        # Each exchange gets its own bucket so a stall on one can't block the other
+        self._bucket = TokenBucket(rate=self.api_rate_limit, capacity=self.api_burst)
+        self._crypto_bucket = TokenBucket(
+            rate=self.api_rate_limit, capacity=self.api_burst
+        )
 
         # Strategy parameters
-        self.short_ma_period = int(os.getenv("short_ma_period", "10"))
-        self.long_ma_period = int(os.getenv("long_ma_period", "20"))
+        self.short_ma_period = self.config.short_ma_period
+        self.long_ma_period = self.config.long_ma_period
+
+        # Historical bars cache: (symbol, interval, span) -> (timestamp, bars).
+        # Day bars only change once per session, so a few hours is plenty.
+        self.historicals_ttl = self.config.historicals_cache_ttl
+        self.historicals_cache_dir = self.config.historicals_cache_dir
+        self._hist_cache: dict[tuple, tuple[float, list]] = {}
+        # Moving averages per symbol, updated as new bars arrive: symbol -> (bars, RollingMA)
+        self._ma: dict[str, tuple[list, RollingMA]] = {}
+
+        # Latest prices, kept fresh by a background feed thread so the
+        # trading cycle reads them from memory instead of polling. Each
+        # price is stored with when it arrived, and prices older than
+        # max_quote_age are not traded on.
+        self.price_refresh_interval = self.config.price_refresh_interval
+        self.max_quote_age = self.config.max_quote_age
+        self._prices: dict[str, tuple[float, float]] = {}
+        self._prices_lock = threading.Lock()
+        self._price_feed_stop = threading.Event()
+        self._price_feed: Optional[threading.Thread] = None
 
         # Track daily performance
         self.starting_balance = 0.0
         self.current_balance = 0.0
         self.daily_pnl = 0.0
+        self.state_file = self.config.state_file
+        # Local mirror of stock positions, updated by our own orders and
+        # reconciled with Robinhood every few cycles
+        self.positions: dict[str, int] = {}
+        self.positions_reconcile_cycles = self.config.positions_reconcile_cycles
+        self._positions_synced = False
+        self._cycles_since_sync = 0
+
+        # Portfolio value is refreshed once per cycle and reused within it
+        self.portfolio_cache_ttl = self.config.portfolio_cache_ttl
+        self._portfolio_value = 0.0
+        self._portfolio_value_ts = 0.0
+        # Largest position allowed this cycle, in dollars
+        self._max_position_dollars = 0.0
 
         logger.info(f"Trading Bot initialized - Dry Run: {self.dry_run}")
 
-    def authenticate(self) -> bool:
-        """
-        Authenticate with all configured APIs.
-
-        Returns:
-            bool: True if at least one API connection successful
-        """
-        success_count = 0
-
-        # Robinhood
+    def _auth_robinhood(self) -> bool:
+        """Log in to Robinhood. Returns True on success."""
         try:
-            username = os.getenv("robin_username")
-            password = os.getenv("robin_password")
-            mfa_code = os.getenv("robin_mfa")
+            username = self.config.robin_username
+            password = self.config.robin_password
+            mfa_code = self.config.robin_mfa
 
             if username and password:
-                rh.login(username, password, mfa_code=mfa_code)
-                if rh.get_login_state():
+                # login() returns the session data, or None if it failed
+                if rh.login(username, password, mfa_code=mfa_code):
                     logger.info("✓ Robinhood authentication successful")
-                    success_count += 1
-                else:
-                    logger.warning("✗ Robinhood authentication failed")
+                    return True
+                logger.warning("✗ Robinhood authentication failed")
         except Exception as e:
             logger.error(f"Robinhood authentication error: {e}")
 
-        # Gemini
+        return False
+
+    def _auth_gemini(self) -> bool:
+        """Log in to Gemini. Returns True on success."""
         try:
-            api_key = os.getenv("gemini_account_key")
-            secret_key = os.getenv("gemini_account_secret")
-            sandbox = os.getenv("gemini_sandbox", "true").lower() == "true"
+            api_key = self.config.gemini_account_key
+            secret_key = self.config.gemini_account_secret
+            sandbox = self.config.gemini_sandbox
 
             if api_key and secret_key:
-                gem.login(api_key, secret_key, sandbox=sandbox)
+                gem.use_sand_box_urls(sandbox)
+                gem.login(api_key, secret_key)
                 if gem.get_login_state():
                     logger.info("✓ Gemini authentication successful")
-                    success_count += 1
-                else:
-                    logger.warning("✗ Gemini authentication failed")
+                    return True
+                logger.warning("✗ Gemini authentication failed")
         except Exception as e:
             logger.error(f"Gemini authentication error: {e}")
 
-        # TD Ameritrade
+        return False
+
+    def _auth_tda(self) -> bool:
+        """Log in to TD Ameritrade. Returns True on success."""
         try:
-            encryption_passcode = os.getenv("tda_encryption_passcode")
+            encryption_passcode = self.config.tda_encryption_passcode
 
             if encryption_passcode:
                 tda.login(encryption_passcode)
                 if tda.get_login_state():
                     logger.info("✓ TD Ameritrade authentication successful")
-                    success_count += 1
-                else:
-                    logger.warning("✗ TD Ameritrade authentication failed")
+                    return True
+                logger.warning("✗ TD Ameritrade authentication failed")
         except Exception as e:
             logger.error(f"TD Ameritrade authentication error: {e}")
 
-        return success_count > 0
+        return False
+
+    async def _start_robinhood(self, load_balance: bool) -> bool:
+        """Log in to Robinhood, then fetch the starting balance if needed."""
+        logged_in = await asyncio.to_thread(self._auth_robinhood)
+        if logged_in and load_balance:
+            self.starting_balance = await asyncio.to_thread(self.get_portfolio_value)
+        return logged_in
+
+    async def astart(self) -> bool:
+        """
+        Authenticate with all APIs concurrently and set the starting balance.
+
+        The SDKs are synchronous, so each login runs in a worker thread and
+        startup takes as long as the slowest API instead of all of them.
+
+        Returns:
+            bool: True if at least one API connection successful
+        """
+        # Reuse today's starting balance if the bot was restarted
+        restored = self.load_state() and self.starting_balance > 0
+
+        results = await asyncio.gather(
+            self._start_robinhood(load_balance=not restored),
+            asyncio.to_thread(self._auth_gemini),
+            asyncio.to_thread(self._auth_tda),
+        )
+        return any(results)
 
-    def get_portfolio_value(self) -> float:
+    def authenticate(self) -> bool:
+        """
+        Authenticate with all configured APIs.
+
+        Returns:
+            bool: True if at least one API connection successful
+        """
+        return asyncio.run(self.astart())
+
+    def get_portfolio_value(self, force: bool = False) -> float:
         """
         Get current portfolio value from Robinhood.
 
+        The value is cached for ``portfolio_cache_ttl`` seconds so repeated
+        calls within a trading cycle do not refetch it.
+
+        Args:
+            force: Ignore the cached value and fetch a fresh one
+
         Returns:
             float: Portfolio value in USD
         """
+        now = time.monotonic()
+        if (
+            not force
+            and self._portfolio_value_ts
+            and now - self._portfolio_value_ts < self.portfolio_cache_ttl
+        ):
+            return self._portfolio_value
+
         try:
-            if rh.get_login_state():
-                portfolio = rh.get_portfolio()
+            if rh.helper.LOGGED_IN:
+                self._bucket.acquire()
+                portfolio = rh.load_portfolio_profile()
                 if portfolio and "market_value" in portfolio:
-                    return float(portfolio["market_value"])
+                    self._portfolio_value = float(portfolio["market_value"])
+                    self._portfolio_value_ts = now
+                    return self._portfolio_value
         except Exception as e:
             logger.error(f"Error getting portfolio value: {e}")
 
         return 0.0
 
+    def load_state(self) -> bool:
+        """
+        Restore today's starting balance and last known positions.
+
+        Returns:
+            bool: True if state saved earlier today was restored
+        """
+        try:
+            with open(self.state_file) as f:
+                state = json.load(f)
+        except (OSError, ValueError):
+            return False
+
+        if state.get("date") != date.today().isoformat():
+            return False
+
+        self.starting_balance = float(state.get("starting_balance", 0.0))
+        self.positions = state.get("positions", {})
+        logger.info(f"Restored state from {self.state_file}")
+        return True
+
+    def save_state(self):
+        """Write today's starting balance and current positions to disk."""
+        state = {
+            "date": date.today().isoformat(),
+            "starting_balance": self.starting_balance,
+            "positions": self.positions,
+        }
+        tmp_file = self.state_file + ".tmp"
+        try:
+            with open(tmp_file, "w") as f:
+                json.dump(state, f)
+            os.replace(tmp_file, self.state_file)
+        except OSError as e:
+            logger.error(f"Error saving state: {e}")
+
     def check_daily_loss_limit(self) -> bool:
         """
         Check if daily loss limit has been reached.
@@ -168,6 +419,8 @@ class BasicTradingBot:
         """
         Calculate position size based on risk management rules.
 
+        Uses the position budget set at the start of each trading cycle.
+
         Args:
             symbol: Stock symbol
             price: Current price per share
@@ -175,14 +428,211 @@ class BasicTradingBot:
         Returns:
             int: Number of shares to trade
         """
-        portfolio_value = self.get_portfolio_value()
-        if portfolio_value == 0:
+        if self._max_position_dollars == 0:
             return 0
 
-        max_value = portfolio_value * self.max_position_size
-        shares = int(max_value / price)
+        return max(1, int(self._max_position_dollars / price))
+
+    def get_latest_prices(self, symbols: tuple[str, ...]) -> dict[str, float]:
+        """
+        Get the latest price of every symbol with a single quotes request.
+
+        Args:
+            symbols: Stock symbols
+
+        Returns:
+            dict: Symbol -> latest price, missing symbols are left out
+        """
+        prices = {}
 
-        return max(1, shares)
+        try:
+            if rh.helper.LOGGED_IN:
+                self._bucket.acquire()
+                quotes = rh.get_quotes(symbols) or []
+                for quote in quotes:
+                    if quote and quote.get("symbol"):
+                        price = (
+                            quote["last_extended_hours_trade_price"]
+                            or quote["last_trade_price"]
+                        )
+                        if price:
+                            prices[quote["symbol"]] = float(price)
+        except Exception as e:
+            logger.error(f"Error getting latest prices: {e}")
+
+        return prices
+
+    def _run_price_feed(self):
+        """Refresh the shared price map until the feed is stopped."""
+        while not self._price_feed_stop.is_set():
+            prices = self.get_latest_prices(self.stock_symbols)
+            received = time.monotonic()
+            with self._prices_lock:
+                self._prices.update(
+                    (symbol, (price, received)) for symbol, price in prices.items()
+                )
+            self._price_feed_stop.wait(self.price_refresh_interval)
+
+    def start_price_feed(self):
+        """Start the background thread that keeps latest prices up to date."""
+        if self._price_feed and self._price_feed.is_alive():
+            return
+
+        self._price_feed_stop.clear()
+        self._price_feed = threading.Thread(
+            target=self._run_price_feed, name="price-feed", daemon=True
+        )
+        self._price_feed.start()
+        logger.info(f"Price feed started ({self.price_refresh_interval:.1f}s refresh)")
+
+    def stop_price_feed(self):
+        """Stop the background price feed."""
+        self._price_feed_stop.set()
+        if self._price_feed:
+            self._price_feed.join(timeout=self.price_refresh_interval)
+            self._price_feed = None
+
+    def get_prices(self) -> dict[str, float]:
+        """
+        Get the latest prices for all stock symbols.
+
+        Returns:
+            dict: Symbol -> latest price, from the price feed when its quote
+            is fresh and from a direct quotes request otherwise
+        """
+        cutoff = time.monotonic() - self.max_quote_age
+        with self._prices_lock:
+            prices = {
+                symbol: price
+                for symbol, (price, received) in self._prices.items()
+                if received >= cutoff
+            }
+
+        missing = tuple(s for s in self.stock_symbols if s not in prices)
+        if missing:
+            prices.update(self.get_latest_prices(missing))
+        return prices
+
+    def _historicals_path(self, symbol: str, interval: str, span: str) -> str:
+        """Path of the on-disk CSV cache for a set of historical bars."""
+        return os.path.join(
+            self.historicals_cache_dir, f"{symbol}_{interval}_{span}.csv"
+        )
+
+    def _read_historicals_file(
+        self, symbol: str, interval: str, span: str
+    ) -> Optional[tuple[float, list]]:
+        """
+        Read historical bars from the CSV cache if the file is still fresh.
+
+        Returns:
+            tuple: (file age in seconds, cached bars), or None if the file is
+            missing, empty or older than the TTL
+        """
+        path = self._historicals_path(symbol, interval, span)
+        try:
+            age = time.time() - os.path.getmtime(path)
+            if age >= self.historicals_ttl:
+                return None
+            with open(path, newline="") as f:
+                historicals = list(csv.DictReader(f))
+        except OSError:
+            return None
+        return (age, historicals) if historicals else None
+
+    def _write_historicals_file(
+        self, symbol: str, interval: str, span: str, historicals: list
+    ):
+        """Write historical bars to the CSV cache."""
+        path = self._historicals_path(symbol, interval, span)
+        try:
+            os.makedirs(self.historicals_cache_dir, exist_ok=True)
+            with open(path, "w", newline="") as f:
+                writer = csv.DictWriter(f, fieldnames=list(historicals[0]))
+                writer.writeheader()
+                writer.writerows(historicals)
+        except OSError as e:
+            logger.warning(f"Could not write historicals cache for {symbol}: {e}")
+
+    def get_historicals(
+        self, symbol: str, interval: str = "day", span: str = "month"
+    ) -> Optional[list]:
+        """
+        Get historical bars for a symbol, served from cache when fresh.
+
+        Bars are kept in memory for ``historicals_cache_ttl`` seconds and
+        mirrored to a CSV file so a restart does not refetch them.
+
+        Args:
+            symbol: Stock symbol
+            interval: Bar interval passed to Robinhood
+            span: Time span passed to Robinhood
+
+        Returns:
+            list: Historical bars or None
+        """
+        key = (symbol, interval, span)
+        now = time.monotonic()
+
+        cached = self._hist_cache.get(key)
+        if cached and now - cached[0] < self.historicals_ttl:
+            return cached[1]
+
+        from_file = self._read_historicals_file(symbol, interval, span)
+        if from_file:
+            # Date the entry by the file's age, so the bars expire when the
+            # file would rather than a full TTL after loading it
+            age, historicals = from_file
+            self._hist_cache[key] = (now - age, historicals)
+            return historicals
+
+        self._bucket.acquire()
+        historicals = rh.get_stock_historicals(symbol, interval=interval, span=span)
+        if historicals:
+            self._write_historicals_file(symbol, interval, span, historicals)
+            self._hist_cache[key] = (now, historicals)
+        return historicals
+
+    def get_rolling_ma(self, symbol: str) -> Optional[RollingMA]:
+        """
+        Get the rolling moving averages for a symbol.
+
+        The closes are loaded into a RollingMA once and reused until the bars
+        are refetched. When the refetched bars only add newer closes, those
+        are pushed into the existing window instead of rebuilding it.
+
+        Args:
+            symbol: Stock symbol
+
+        Returns:
+            RollingMA: Moving averages, or None if there is not enough data
+        """
+        historicals = self.get_historicals(symbol)
+        if not historicals or len(historicals) < self.long_ma_period:
+            return None
+
+        cached = self._ma.get(symbol)
+        if cached:
+            bars, ma = cached
+            if bars is historicals:
+                return ma
+            closes = _appended_closes(bars, historicals)
+            if closes is not None and len(closes) < self.long_ma_period:
+                for close in closes:
+                    ma.push(close)
+                self._ma[symbol] = (historicals, ma)
+                return ma
+
+        # map() with C-level callables parses each close without a Python
+        # generator frame per bar, straight into from_closes' float array
+        closes = map(float, map(_close_price, historicals[-self.long_ma_period :]))
+        ma = RollingMA.from_closes(
+            closes,
+            self.short_ma_period,
+            self.long_ma_period,
+        )
+        self._ma[symbol] = (historicals, ma)
+        return ma
 
     def get_moving_averages(self, symbol: str) -> dict[str, Optional[float]]:
         """
@@ -196,73 +646,54 @@ class BasicTradingBot:
         """
         try:
             # Get historical data (simplified - in production use proper historical data)
-            if rh.get_login_state():
-                historicals = rh.get_stock_historicals(
-                    symbol, interval="day", span="month"
-                )
-
-                if historicals and len(historicals) >= self.long_ma_period:
-                    prices = [
-                        float(h["close_price"])
-                        for h in historicals[-self.long_ma_period :]
-                    ]
-
-                    short_ma = (
-                        sum(prices[-self.short_ma_period :]) / self.short_ma_period
-                    )
-                    long_ma = sum(prices) / self.long_ma_period
+            if rh.helper.LOGGED_IN:
+                ma = self.get_rolling_ma(symbol)
 
+                if ma is not None:
+                    short_ma, long_ma, current_price = ma.values()
                     return {
                         "short_ma": short_ma,
                         "long_ma": long_ma,
-                        "current_price": prices[-1],
+                        "current_price": current_price,
                     }
         except Exception as e:
             logger.error(f"Error calculating moving averages for {symbol}: {e}")
 
         return {"short_ma": None, "long_ma": None, "current_price": None}
 
-    def should_buy(self, symbol: str) -> bool:
+    def decide(self, symbol: str) -> Literal["buy", "sell", "hold"]:
         """
-        Determine if we should buy a symbol based on strategy.
+        Decide what to do with a symbol based on the moving average strategy.
 
         Args:
             symbol: Stock symbol
 
         Returns:
-            bool: True if should buy
+            str: "buy" if the short MA is above the long MA, "sell" if it is
+            below, "hold" otherwise or when there is not enough data
         """
         mas = self.get_moving_averages(symbol)
+        short_ma = mas["short_ma"]
+        long_ma = mas["long_ma"]
+
+        if short_ma is None or long_ma is None:
+            return "hold"
 
         # Buy signal: short MA crosses above long MA
-        if all(mas.values()) and mas["short_ma"] > mas["long_ma"]:
+        if short_ma > long_ma:
             logger.info(
-                f"{symbol}: Buy signal - Short MA {mas['short_ma']:.2f} > Long MA {mas['long_ma']:.2f}"
+                f"{symbol}: Buy signal - Short MA {short_ma:.2f} > Long MA {long_ma:.2f}"
             )
-            return True
-
-        return False
-
-    def should_sell(self, symbol: str) -> bool:
-        """
-        Determine if we should sell a symbol based on strategy.
-
-        Args:
-            symbol: Stock symbol
-
-        Returns:
-            bool: True if should sell
-        """
-        mas = self.get_moving_averages(symbol)
+            return "buy"
 
         # Sell signal: short MA crosses below long MA
-        if all(mas.values()) and mas["short_ma"] < mas["long_ma"]:
+        if short_ma < long_ma:
             logger.info(
-                f"{symbol}: Sell signal - Short MA {mas['short_ma']:.2f} < Long MA {mas['long_ma']:.2f}"
+                f"{symbol}: Sell signal - Short MA {short_ma:.2f} < Long MA {long_ma:.2f}"
             )
-            return True
+            return "sell"
 
-        return False
+        return "hold"
 
     def place_buy_order(self, symbol: str, quantity: int) -> Optional[dict]:
         """
@@ -280,9 +711,12 @@ class BasicTradingBot:
             return {"status": "dry_run_buy", "symbol": symbol, "quantity": quantity}
 
         try:
-            if rh.get_login_state():
+            if rh.helper.LOGGED_IN:
+                self._bucket.acquire()
                 order = rh.orders.order_buy_market(symbol, quantity)
                 logger.info(f"BUY order placed: {quantity} shares of {symbol}")
+                if order:
+                    self.positions[symbol] = self.positions.get(symbol, 0) + quantity
                 return order
         except Exception as e:
             logger.error(f"Error placing buy order for {symbol}: {e}")
@@ -305,82 +739,230 @@ class BasicTradingBot:
             return {"status": "dry_run_sell", "symbol": symbol, "quantity": quantity}
 
         try:
-            if rh.get_login_state():
+            if rh.helper.LOGGED_IN:
+                self._bucket.acquire()
                 order = rh.orders.order_sell_market(symbol, quantity)
                 logger.info(f"SELL order placed: {quantity} shares of {symbol}")
+                if order:
+                    remaining = self.positions.get(symbol, 0) - quantity
+                    if remaining > 0:
+                        self.positions[symbol] = remaining
+                    else:
+                        self.positions.pop(symbol, None)
                 return order
         except Exception as e:
             logger.error(f"Error placing sell order for {symbol}: {e}")
 
         return None
 
-    def get_current_positions(self) -> dict[str, int]:
+    def get_current_positions(self) -> Optional[dict[str, int]]:
         """
         Get current stock positions.
 
         Returns:
-            dict: Symbol -> quantity mapping
+            dict: Symbol -> quantity mapping, or None if the positions could
+            not be fetched
         """
-        positions = {}
+        if not rh.helper.LOGGED_IN:
+            return None
 
         try:
-            if rh.get_login_state():
-                holdings = rh.get_open_stock_positions()
-                for holding in holdings:
-                    if holding and "quantity" in holding and "symbol" in holding:
-                        quantity = int(float(holding["quantity"]))
-                        if quantity > 0:
-                            positions[holding["symbol"]] = quantity
+            self._bucket.acquire()
+            holdings = rh.get_open_stock_positions()
+            # The library returns [None] when the request fails
+            if holdings is None or holdings == [None]:
+                return None
+            # One pass over the holdings, parsing each quantity once
+            quantities = (
+                (holding.get("symbol"), int(float(holding.get("quantity") or 0)))
+                for holding in holdings
+                if holding
+            )
+            return {
+                symbol: quantity
+                for symbol, quantity in quantities
+                if symbol and quantity > 0
+            }
         except Exception as e:
             logger.error(f"Error getting positions: {e}")
 
-        return positions
-
-    def run_trading_cycle(self):
-        """Run one trading cycle for all symbols."""
-        logger.info("Starting trading cycle...")
+        return None
 
-        # Check daily loss limit
-        if self.check_daily_loss_limit():
-            logger.warning("Daily loss limit reached. Stopping trading.")
+    def sync_positions(self):
+        """Reconcile the local positions mirror with Robinhood, logging drift."""
+        positions = self.get_current_positions()
+        if positions is None:
+            # Keep the current mirror; the next cycle tries again
+            logger.warning("Could not fetch positions, keeping the local mirror")
             return
 
-        # Get current positions
-        positions = self.get_current_positions()
+        if self._positions_synced:
+            for symbol in self.positions.keys() | positions.keys():
+                local = self.positions.get(symbol, 0)
+                remote = positions.get(symbol, 0)
+                if local != remote:
+                    logger.warning(
+                        f"{symbol}: Position drift - local {local}, Robinhood {remote}"
+                    )
+
+        self.positions = positions
+        self._positions_synced = True
+        self._cycles_since_sync = 0
+
+    def _process_stocks(self):
+        """Run the moving average strategy over all stock symbols."""
+        # Positions only change through our own orders, so only go to
+        # Robinhood on the first cycle and every few cycles after that
+        if (
+            not self._positions_synced
+            or self._cycles_since_sync >= self.positions_reconcile_cycles
+        ):
+            self.sync_positions()
+        self._cycles_since_sync += 1
+        positions = self.positions
+
+        # Prices come from the feed, then fetch the historicals concurrently
+        # so the strategy below reads them from the cache.
+        prices = self.get_prices()
+        try:
+            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                list(executor.map(self.get_historicals, prices))
+        except Exception as e:
+            logger.error(f"Error prefetching historicals: {e}")
+
+        # Bind the methods used per symbol to locals before the loop
+        decide = self.decide
+        calc_qty = self.calculate_position_size
+        price_get = prices.get
+        pos_get = positions.get
+
+        # Decide on every symbol first, then place the orders together
+        orders: list[tuple[str, str, int]] = []
+        add_order = orders.append
 
-        # Process each symbol
         for symbol in self.stock_symbols:
             try:
-                time.sleep(self.api_delay)  # Rate limiting
-
-                # Get current price
-                price_data = rh.get_latest_price(symbol)
-                if not price_data:
+                current_price = price_get(symbol)
+                if current_price is None:
                     continue
 
-                current_price = float(price_data[0])
-                current_quantity = positions.get(symbol, 0)
+                current_quantity = pos_get(symbol, 0)
 
                 logger.info(
                     f"{symbol}: Price ${current_price:.2f}, Holdings: {current_quantity}"
                 )
 
                 # Trading logic
+                signal = decide(symbol)
                 if current_quantity == 0:
-                    # No position - check for buy signal
-                    if self.should_buy(symbol):
-                        quantity = self.calculate_position_size(symbol, current_price)
+                    # No position - act on a buy signal
+                    if signal == "buy":
+                        quantity = calc_qty(symbol, current_price)
                         if quantity > 0:
-                            self.place_buy_order(symbol, quantity)
+                            add_order((symbol, "buy", quantity))
 
-                else:
-                    # Have position - check for sell signal
-                    if self.should_sell(symbol):
-                        self.place_sell_order(symbol, current_quantity)
+                elif signal == "sell":
+                    # Have position - act on a sell signal
+                    add_order((symbol, "sell", current_quantity))
 
             except Exception as e:
                 logger.error(f"Error processing {symbol}: {e}")
 
+        self.dispatch_orders(orders)
+
+    def _dispatch(self, symbol: str, side: str, quantity: int) -> Optional[dict]:
+        """Place a single buy or sell order."""
+        if side == "buy":
+            return self.place_buy_order(symbol, quantity)
+        return self.place_sell_order(symbol, quantity)
+
+    def dispatch_orders(self, orders: list[tuple[str, str, int]]):
+        """
+        Place a cycle's orders concurrently.
+
+        Each order still takes a token from the rate limiter, so the orders
+        go out as fast as the API limit allows instead of one at a time.
+
+        Args:
+            orders: (symbol, side, quantity) tuples where side is "buy" or "sell"
+        """
+        if not orders:
+            return
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            futures = {
+                executor.submit(self._dispatch, symbol, side, quantity): symbol
+                for symbol, side, quantity in orders
+            }
+            for future in as_completed(futures):
+                try:
+                    future.result()
+                except Exception as e:
+                    logger.error(f"Error placing order for {futures[future]}: {e}")
+
+    def get_crypto_prices(self) -> dict[str, float]:
+        """
+        Get the last trade price of each crypto symbol from Gemini.
+
+        Returns:
+            dict: Symbol -> last price, missing symbols are left out
+        """
+        prices = {}
+
+        for symbol in self.crypto_symbols:
+            try:
+                self._crypto_bucket.acquire()
+                ticker, err = gem.get_pubticker(symbol, jsonify=True)
+                if err is None and ticker and "last" in ticker:
+                    prices[symbol] = float(ticker["last"])
+            except Exception as e:
+                logger.error(f"Error getting Gemini price for {symbol}: {e}")
+
+        return prices
+
+    def _process_crypto(self):
+        """Log the latest crypto prices."""
+        for symbol, price in self.get_crypto_prices().items():
+            logger.info(f"{symbol}: Price ${price:.2f}")
+
+    async def _stock_cycle(self):
+        """Run the stock leg in a worker thread."""
+        await asyncio.to_thread(self._process_stocks)
+
+    async def _crypto_cycle(self):
+        """Run the crypto leg in a worker thread."""
+        await asyncio.to_thread(self._process_crypto)
+
+    async def _run_legs(self):
+        """
+        Run the stock leg, and the crypto leg if monitor_crypto is set.
+
+        Robinhood and Gemini calls run in separate threads with separate rate
+        limits, so slow responses from one exchange don't hold up the other.
+        """
+        legs = {"stock": self._stock_cycle()}
+        if self.monitor_crypto:
+            legs["crypto"] = self._crypto_cycle()
+        results = await asyncio.gather(*legs.values(), return_exceptions=True)
+        for leg, result in zip(legs, results):
+            if isinstance(result, Exception):
+                logger.error(f"Error in {leg} cycle: {result}")
+
+    def run_trading_cycle(self):
+        """Run one trading cycle for all symbols."""
+        logger.info("Starting trading cycle...")
+
+        # Refresh the portfolio value once; the rest of the cycle reuses it
+        portfolio_value = self.get_portfolio_value(force=True)
+        self._max_position_dollars = portfolio_value * self.max_position_size
+
+        # Check daily loss limit
+        if self.check_daily_loss_limit():
+            logger.warning("Daily loss limit reached. Stopping trading.")
+            return
+
+        asyncio.run(self._run_legs())
+
         # Log performance
         if self.starting_balance > 0:
             logger.info(
@@ -396,14 +978,15 @@ class BasicTradingBot:
         """
         logger.info("Starting Trading Bot...")
 
-        # Authenticate
+        # Authenticate and set starting balance
         if not self.authenticate():
             logger.error("Authentication failed for all APIs. Exiting.")
             return
 
-        # Set starting balance
-        self.starting_balance = self.get_portfolio_value()
         logger.info(f"Starting portfolio value: ${self.starting_balance:.2f}")
+        self.save_state()
+
+        self.start_price_feed()
 
         # Run trading cycles
         for cycle in range(cycles):
@@ -411,6 +994,7 @@ class BasicTradingBot:
 
             try:
                 self.run_trading_cycle()
+                self.save_state()
 
                 if cycle < cycles - 1:
                     logger.info("Waiting for next cycle...")
@@ -422,6 +1006,7 @@ class BasicTradingBot:
             except Exception as e:
                 logger.error(f"Error in trading cycle: {e}")
 
+        self.stop_price_feed()
         logger.info("Trading bot finished.")
 
 
@@ -16,12 +16,20 @@ Usage:
     python crypto_arbitrage_bot.py
 """
 
+import asyncio
 import logging
 import os
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from decimal import Decimal
+from operator import itemgetter
+from types import MappingProxyType
 from typing import Optional
 
 from dotenv import load_dotenv
+from trading_utils import PriceCache, TokenBucket
 
 import robin_stocks.gemini as gem
 import robin_stocks.robinhood as rh
@@ -37,119 +45,303 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Symbol mapping between exchanges (Gemini -> Robinhood), built once at import
+# and shared read-only by every bot
+SYMBOL_MAPPING = MappingProxyType({"btcusd": "BTC", "ethusd": "ETH", "ltcusd": "LTC"})
+REVERSE_SYMBOL_MAPPING = MappingProxyType(
+    {rh_symbol: gemini_symbol for gemini_symbol, rh_symbol in SYMBOL_MAPPING.items()}
+)
+# Crypto symbols to monitor (Gemini format)
+CRYPTO_SYMBOLS = tuple(SYMBOL_MAPPING)
+
+# (direction, profitable_exchange, cheaper_exchange) for each side of a spread
+SELL_GEMINI_BUY_RH = ("sell_gemini_buy_rh", "Gemini", "Robinhood")
+SELL_RH_BUY_GEMINI = ("sell_rh_buy_gemini", "Robinhood", "Gemini")
+
+# Estimated trading fees (typical crypto trading fees), as a fraction of the
+# trade amount. Both legs are charged on the same amount, so they combine.
+GEMINI_FEE_RATE = Decimal("0.0035")  # 0.35% fee
+ROBINHOOD_FEE_RATE = Decimal("0.0025")  # 0.25% fee (estimated)
+TOTAL_FEE_RATE = GEMINI_FEE_RATE + ROBINHOOD_FEE_RATE
+
+_gemini_balance = itemgetter("currency", "available")
+
+
+def _robinhood_balances(positions: Optional[list]) -> list:
+    """Turn Robinhood crypto positions into (symbol, quantity) pairs."""
+    return [
+        (position["currency"]["code"], float(position["quantity"]))
+        for position in positions or ()
+        if position
+    ]
+
+
+def _gemini_balances(balances: Optional[list]) -> list:
+    """Turn Gemini available balances into (symbol, quantity) pairs."""
+    return [
+        (symbol, float(available))
+        for symbol, available in map(_gemini_balance, filter(None, balances or ()))
+    ]
+
+
+@dataclass(frozen=True)
+class ArbitrageConfig:
+    """Bot settings, read once from the environment."""
+
+    dry_run: bool
+    max_workers: int
+    price_refresh_interval: float
+    api_rate_limit: float
+    api_burst: int
+    max_quote_age: float
+    robin_username: Optional[str]
+    robin_password: Optional[str]
+    gemini_account_key: Optional[str]
+    gemini_account_secret: Optional[str]
+    gemini_sandbox: bool
+
+    @classmethod
+    def from_env(cls) -> "ArbitrageConfig":
+        """Build the configuration from environment variables."""
+        return cls(
+            dry_run=os.getenv("dry_run_mode", "true").lower() == "true",
+            max_workers=int(os.getenv("max_workers", "4")),
+            price_refresh_interval=float(os.getenv("price_refresh_interval", "5.0")),
+            api_rate_limit=float(os.getenv("api_rate_limit", "5.0")),
+            api_burst=int(os.getenv("api_burst", "10")),
+            max_quote_age=float(os.getenv("max_quote_age", "15.0")),
+            robin_username=os.getenv("robin_username"),
+            robin_password=os.getenv("robin_password"),
+            gemini_account_key=os.getenv("gemini_account_key"),
+            gemini_account_secret=os.getenv("gemini_account_secret"),
+            gemini_sandbox=os.getenv("gemini_sandbox", "true").lower() == "true",
+        )
+
 
 class CryptoArbitrageBot:
     """
     Monitor cryptocurrency prices across multiple exchanges for arbitrage opportunities.
     """
 
-    def __init__(self):
-        """Initialize the arbitrage bot."""
-        self.dry_run = os.getenv("dry_run_mode", "true").lower() == "true"
-        self.min_profit_threshold = 0.005  # 0.5% minimum profit
-        self.api_delay = float(os.getenv("api_delay", "2.0"))
-
-        # Crypto symbols to monitor (Gemini format)
-        self.crypto_symbols = ["btcusd", "ethusd", "ltcusd"]
+    def __init__(self, config: Optional[ArbitrageConfig] = None):
+        """
+        Initialize the arbitrage bot.
 
-        # Symbol mapping between exchanges
-        self.symbol_mapping = {
-            "btcusd": "BTC",  # Gemini -> Robinhood
-            "ethusd": "ETH",
-            "ltcusd": "LTC",
+        Args:
+            config: Bot settings, read from the environment if not given
+        """
+        self.config = config or ArbitrageConfig.from_env()
+        self.dry_run = self.config.dry_run
+        # Money math is done in Decimal, parsed straight from the API's price
+        # strings, so thin margins are not skewed by binary float rounding
+        self.min_profit_threshold = Decimal("0.005")  # 0.5% minimum profit
+        # Each exchange's requests run on its own long-lived worker threads,
+        # reused across refreshes. Gemini is queried per symbol, so up to
+        # max_workers requests are in flight; Robinhood sends one batch.
+        self._gemini_executor = ThreadPoolExecutor(
+            max_workers=self.config.max_workers, thread_name_prefix="gemini"
+        )
+        self._rh_executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="robinhood"
+        )
+        self.price_refresh_interval = self.config.price_refresh_interval
+        # Each exchange gets its own rate limit; requests only wait once
+        # the burst allowance is used up
+        self._gemini_bucket = TokenBucket(
+            self.config.api_rate_limit, self.config.api_burst
+        )
+        self._rh_bucket = TokenBucket(self.config.api_rate_limit, self.config.api_burst)
+        # Quotes older than this are not used to judge an opportunity
+        self.max_quote_age = self.config.max_quote_age
+
+        # Latest quotes per exchange, keyed by Gemini symbol and kept
+        # current by the background price feed. A move of half the minimum
+        # profit on either side can open or close an opportunity.
+        move_threshold = self.min_profit_threshold / 2
+        self.latest_prices = {
+            "gemini": PriceCache(move_threshold=move_threshold),
+            "robinhood": PriceCache(move_threshold=move_threshold),
         }
+        self._price_feed = None
+        self._price_feed_stop = threading.Event()
+        # Set by the price feed whenever a quote moves enough to rescan
+        self._prices_moved = threading.Event()
+
+        self.crypto_symbols = CRYPTO_SYMBOLS
+        self.symbol_mapping = SYMBOL_MAPPING
+        self.reverse_symbol_mapping = REVERSE_SYMBOL_MAPPING
+
+        # Login state recorded by authenticate(), read on every request
+        self._rh_logged_in = False
+        self._gem_logged_in = False
 
         logger.info(f"Crypto Arbitrage Bot initialized - Dry Run: {self.dry_run}")
 
     def authenticate(self) -> bool:
         """Authenticate with exchanges."""
-        success_count = 0
 
         # Robinhood
         try:
-            username = os.getenv("robin_username")
-            password = os.getenv("robin_password")
+            username = self.config.robin_username
+            password = self.config.robin_password
 
             if username and password:
-                rh.login(username, password)
-                if rh.get_login_state():
+                # login() returns the session data, or None if it failed
+                self._rh_logged_in = bool(rh.login(username, password))
+                if self._rh_logged_in:
                     logger.info("✓ Robinhood authentication successful")
-                    success_count += 1
         except Exception as e:
             logger.error(f"Robinhood authentication error: {e}")
 
         # Gemini
         try:
-            api_key = os.getenv("gemini_account_key")
-            secret_key = os.getenv("gemini_account_secret")
-            sandbox = os.getenv("gemini_sandbox", "true").lower() == "true"
+            api_key = self.config.gemini_account_key
+            secret_key = self.config.gemini_account_secret
+            sandbox = self.config.gemini_sandbox
 
             if api_key and secret_key:
-                gem.login(api_key, secret_key, sandbox=sandbox)
-                if gem.get_login_state():
+                gem.use_sand_box_urls(sandbox)
+                gem.login(api_key, secret_key)
+                self._gem_logged_in = gem.get_login_state()
+                if self._gem_logged_in:
                     logger.info("✓ Gemini authentication successful")
-                    success_count += 1
         except Exception as e:
             logger.error(f"Gemini authentication error: {e}")
 
-        return success_count >= 2  # Need both exchanges
+        return self._rh_logged_in and self._gem_logged_in  # Need both exchanges
 
-    def get_robinhood_crypto_price(self, symbol: str) -> Optional[float]:
+    def get_robinhood_crypto_quotes(self, symbols: list) -> dict:
         """
-        Get cryptocurrency price from Robinhood.
+        Get cryptocurrency bids and asks from Robinhood in one request.
 
         Args:
-            symbol: Crypto symbol (e.g., 'BTC')
+            symbols: Crypto symbols (e.g., ['BTC', 'ETH'])
 
         Returns:
-            float: Current price or None
+            dict: Symbol -> (bid, ask) for every symbol that was quoted
         """
+        quotes = {}
         try:
-            if rh.get_login_state():
-                price_data = rh.crypto.get_crypto_quote(symbol)
-                if (
-                    price_data
-                    and "bid_price" in price_data
-                    and "ask_price" in price_data
-                ):
-                    # Use mid price
-                    bid = float(price_data["bid_price"])
-                    ask = float(price_data["ask_price"])
-                    return (bid + ask) / 2
+            if self._rh_logged_in:
+                self._rh_bucket.acquire()
+                # Ids are cached after the first lookup, so this is free
+                symbol_for_id = {rh.crypto.get_crypto_id(s): s for s in symbols}
+                for price_data in rh.get_crypto_quotes(symbols) or []:
+                    symbol = symbol_for_id.get(price_data.get("id"))
+                    if (
+                        symbol
+                        and "bid_price" in price_data
+                        and "ask_price" in price_data
+                    ):
+                        quotes[symbol] = (
+                            Decimal(price_data["bid_price"]),
+                            Decimal(price_data["ask_price"]),
+                        )
         except Exception as e:
-            logger.error(f"Error getting Robinhood price for {symbol}: {e}")
+            logger.error(f"Error getting Robinhood prices for {symbols}: {e}")
 
-        return None
+        return quotes
 
-    def get_gemini_crypto_price(self, symbol: str) -> Optional[float]:
+    def get_gemini_crypto_quote(self, symbol: str) -> Optional[tuple]:
         """
-        Get cryptocurrency price from Gemini.
+        Get cryptocurrency bid and ask from Gemini.
 
         Args:
             symbol: Crypto symbol (e.g., 'btcusd')
 
         Returns:
-            float: Current price or None
+            tuple: (bid, ask) or None
         """
         try:
-            if gem.get_login_state():
-                ticker = gem.get_pubticker(symbol)
-                if ticker and "bid" in ticker and "ask" in ticker:
-                    # Use mid price
-                    bid = float(ticker["bid"])
-                    ask = float(ticker["ask"])
-                    return (bid + ask) / 2
+            if self._gem_logged_in:
+                self._gemini_bucket.acquire()
+                ticker, err = gem.get_pubticker(symbol, jsonify=True)
+                if err is None and ticker and "bid" in ticker and "ask" in ticker:
+                    return Decimal(ticker["bid"]), Decimal(ticker["ask"])
         except Exception as e:
             logger.error(f"Error getting Gemini price for {symbol}: {e}")
 
         return None
 
-    def calculate_arbitrage_opportunity(self, gemini_symbol: str) -> dict:
+    async def refresh_prices(self):
+        """
+        Fetch every symbol's quote from both exchanges at the same time and
+        store them in latest_prices.
+        """
+        loop = asyncio.get_running_loop()
+        gemini_cache = self.latest_prices["gemini"]
+        rh_cache = self.latest_prices["robinhood"]
+        gemini_for_rh = self.reverse_symbol_mapping
+        prices_moved = self._prices_moved
+
+        async def fetch_gemini(symbol):
+            quote = await loop.run_in_executor(
+                self._gemini_executor, self.get_gemini_crypto_quote, symbol
+            )
+            if quote and gemini_cache.update(symbol, *quote):
+                prices_moved.set()
+
+        async def fetch_robinhood():
+            # Robinhood quotes every symbol in a single batch request
+            quotes = await loop.run_in_executor(
+                self._rh_executor, self.get_robinhood_crypto_quotes, list(gemini_for_rh)
+            )
+            for rh_symbol, quote in quotes.items():
+                if rh_cache.update(gemini_for_rh[rh_symbol], *quote):
+                    prices_moved.set()
+
+        await asyncio.gather(
+            fetch_robinhood(),
+            *(fetch_gemini(symbol) for symbol in self.crypto_symbols),
+        )
+
+    def _run_price_feed(self):
+        """Refresh quotes until the price feed is stopped."""
+        while not self._price_feed_stop.is_set():
+            try:
+                asyncio.run(self.refresh_prices())
+            except Exception as e:
+                logger.error(f"Error refreshing prices: {e}")
+            self._price_feed_stop.wait(self.price_refresh_interval)
+
+    def start_price_feed(self):
+        """Start the background thread that keeps latest_prices up to date."""
+        if self._price_feed and self._price_feed.is_alive():
+            return
+
+        self._price_feed_stop.clear()
+        self._price_feed = threading.Thread(
+            target=self._run_price_feed, name="price-feed", daemon=True
+        )
+        self._price_feed.start()
+        logger.info(f"Price feed started ({self.price_refresh_interval:.1f}s refresh)")
+
+    def stop_price_feed(self):
+        """Stop the background price feed."""
+        self._price_feed_stop.set()
+        if self._price_feed:
+            self._price_feed.join(timeout=self.price_refresh_interval)
+            self._price_feed = None
+
+    def close(self):
+        """Stop the price feed and release the exchange worker threads."""
+        self.stop_price_feed()
+        self._gemini_executor.shutdown(wait=False)
+        self._rh_executor.shutdown(wait=False)
+
+    def calculate_arbitrage_opportunity(
+        self,
+        gemini_symbol: str,
+        gemini_price: Optional[Decimal] = None,
+        rh_price: Optional[Decimal] = None,
+    ) -> dict:
         """
         Calculate arbitrage opportunity for a symbol.
 
         Args:
             gemini_symbol: Symbol in Gemini format
+            gemini_price: Gemini mid price, read from the latest quotes if omitted
+            rh_price: Robinhood mid price, read from the latest quotes if omitted
 
         Returns:
             dict: Arbitrage analysis
@@ -158,12 +350,17 @@ class CryptoArbitrageBot:
         if not rh_symbol:
             return {"error": "Symbol mapping not found"}
 
-        # Get prices from both exchanges
-        gemini_price = self.get_gemini_crypto_price(gemini_symbol)
-        rh_price = self.get_robinhood_crypto_price(rh_symbol)
+        if gemini_price is None:
+            gemini_price = self.latest_prices["gemini"].mid(
+                gemini_symbol, self.max_quote_age
+            )
+        if rh_price is None:
+            rh_price = self.latest_prices["robinhood"].mid(
+                gemini_symbol, self.max_quote_age
+            )
 
         if not gemini_price or not rh_price:
-            return {"error": "Failed to get prices"}
+            return {"error": "Missing or stale prices"}
 
         # Calculate arbitrage metrics
         price_diff = abs(gemini_price - rh_price)
@@ -171,20 +368,16 @@ class CryptoArbitrageBot:
         profit_percentage = price_diff / avg_price
 
         # Determine direction
-        if gemini_price > rh_price:
-            direction = "sell_gemini_buy_rh"
-            profitable_exchange = "Gemini"
-            cheaper_exchange = "Robinhood"
-        else:
-            direction = "sell_rh_buy_gemini"
-            profitable_exchange = "Robinhood"
-            cheaper_exchange = "Gemini"
+        direction, profitable_exchange, cheaper_exchange = (
+            SELL_GEMINI_BUY_RH if gemini_price > rh_price else SELL_RH_BUY_GEMINI
+        )
 
         return {
             "symbol": gemini_symbol,
             "rh_symbol": rh_symbol,
             "gemini_price": gemini_price,
             "rh_price": rh_price,
+            "avg_price": avg_price,
             "price_diff": price_diff,
             "profit_percentage": profit_percentage,
             "direction": direction,
@@ -204,35 +397,26 @@ class CryptoArbitrageBot:
 
         # Robinhood balances
         try:
-            if rh.get_login_state():
-                crypto_positions = rh.crypto.get_crypto_positions()
-                for position in crypto_positions:
-                    if position and "currency" in position and "quantity" in position:
-                        symbol = position["currency"]["code"]
-                        quantity = float(position["quantity"])
-                        if quantity > 0:
-                            balances["robinhood"][symbol] = quantity
+            if self._rh_logged_in:
+                positions = _robinhood_balances(rh.crypto.get_crypto_positions())
+                balances["robinhood"] = {s: q for s, q in positions if q > 0}
         except Exception as e:
             logger.error(f"Error getting Robinhood balances: {e}")
 
         # Gemini balances
         try:
-            if gem.get_login_state():
-                account_detail = gem.get_account_detail()
-                if isinstance(account_detail, list):
-                    for balance in account_detail:
-                        if balance and "currency" in balance and "available" in balance:
-                            symbol = balance["currency"]
-                            available = float(balance["available"])
-                            if available > 0:
-                                balances["gemini"][symbol] = available
+            if self._gem_logged_in:
+                available, err = gem.check_available_balances(jsonify=True)
+                if err is None:
+                    available = _gemini_balances(available)
+                    balances["gemini"] = {s: q for s, q in available if q > 0}
         except Exception as e:
             logger.error(f"Error getting Gemini balances: {e}")
 
         return balances
 
     def simulate_arbitrage_trade(
-        self, opportunity: dict, trade_amount_usd: float = 100.0
+        self, opportunity: dict, trade_amount_usd: Decimal = Decimal("100")
     ):
         """
         Simulate an arbitrage trade.
@@ -241,53 +425,69 @@ class CryptoArbitrageBot:
             opportunity: Arbitrage opportunity data
             trade_amount_usd: Amount to trade in USD
         """
+        # The simulation is only ever reported, so skip it when INFO is off
+        if not logger.isEnabledFor(logging.INFO):
+            return
+
         symbol = opportunity["symbol"]
         profit_pct = opportunity["profit_percentage"]
 
-        # Calculate trade details
-        avg_price = (opportunity["gemini_price"] + opportunity["rh_price"]) / 2
-        crypto_amount = trade_amount_usd / avg_price
+        # Calculate trade details. Fees are a fixed share of the trade, so the
+        # net return is the spread minus the combined fee rate.
+        crypto_amount = trade_amount_usd / opportunity["avg_price"]
         expected_profit = trade_amount_usd * profit_pct
+        total_fees = trade_amount_usd * TOTAL_FEE_RATE
+        net_profit_pct = profit_pct - TOTAL_FEE_RATE
+        net_profit = trade_amount_usd * net_profit_pct
 
-        # Estimate fees (typical crypto trading fees)
-        gemini_fee = trade_amount_usd * 0.0035  # 0.35% fee
-        rh_fee = trade_amount_usd * 0.0025  # 0.25% fee (estimated)
-        total_fees = gemini_fee + rh_fee
-
-        net_profit = expected_profit - total_fees
-        net_profit_pct = net_profit / trade_amount_usd
+        if net_profit > 0:
+            verdict = "✅ Profitable after fees!"
+        else:
+            verdict = "❌ Not profitable after fees."
 
-        logger.info(f"\n📊 ARBITRAGE SIMULATION - {symbol.upper()}")
-        logger.info(f"   Gemini Price: ${opportunity['gemini_price']:.2f}")
-        logger.info(f"   Robinhood Price: ${opportunity['rh_price']:.2f}")
+        # One log record for the whole report instead of one per line
         logger.info(
-            f"   Price Difference: ${opportunity['price_diff']:.2f} ({profit_pct:.2%})"
+            f"\n📊 ARBITRAGE SIMULATION - {symbol.upper()}\n"
+            f"   Gemini Price: ${opportunity['gemini_price']:.2f}\n"
+            f"   Robinhood Price: ${opportunity['rh_price']:.2f}\n"
+            f"   Price Difference: ${opportunity['price_diff']:.2f} ({profit_pct:.2%})\n"
+            f"   Direction: {opportunity['direction']}\n"
+            "   \n"
+            f"   Trade Amount: ${trade_amount_usd:.2f}\n"
+            f"   Crypto Amount: {crypto_amount:.6f} {opportunity['rh_symbol']}\n"
+            f"   Gross Profit: ${expected_profit:.2f}\n"
+            f"   Estimated Fees: ${total_fees:.2f}\n"
+            f"   Net Profit: ${net_profit:.2f} ({net_profit_pct:.2%})\n"
+            f"   {verdict}"
         )
-        logger.info(f"   Direction: {opportunity['direction']}")
-        logger.info("   ")
-        logger.info(f"   Trade Amount: ${trade_amount_usd:.2f}")
-        logger.info(f"   Crypto Amount: {crypto_amount:.6f} {opportunity['rh_symbol']}")
-        logger.info(f"   Gross Profit: ${expected_profit:.2f}")
-        logger.info(f"   Estimated Fees: ${total_fees:.2f}")
-        logger.info(f"   Net Profit: ${net_profit:.2f} ({net_profit_pct:.2%})")
-
-        if net_profit > 0:
-            logger.info("   ✅ Profitable after fees!")
-        else:
-            logger.info("   ❌ Not profitable after fees.")
 
-    def monitor_arbitrage_opportunities(self):
+    async def monitor_arbitrage_opportunities(self):
         """
         Monitor and report arbitrage opportunities.
+
+        Reads the quotes kept by the price feed. Without a running feed, or
+        before its first refresh lands, the quotes are fetched here first.
         """
         logger.info("🔍 Scanning for arbitrage opportunities...")
 
+        feed_running = self._price_feed and self._price_feed.is_alive()
+        if not feed_running or not self.latest_prices["gemini"].quotes:
+            await self.refresh_prices()
+
+        # Take one snapshot of each exchange's fresh quotes for the whole scan,
+        # and measure the moves that trigger the next scan from it, so slow
+        # drift adds up instead of being compared tick by tick
+        for cache in self.latest_prices.values():
+            cache.rebase()
+        gemini_prices = self.latest_prices["gemini"].mids(self.max_quote_age)
+        rh_prices = self.latest_prices["robinhood"].mids(self.max_quote_age)
+
         opportunities = []
 
         for symbol in self.crypto_symbols:
-            time.sleep(self.api_delay)  # Rate limiting
-
-            opportunity = self.calculate_arbitrage_opportunity(symbol)
+            opportunity = self.calculate_arbitrage_opportunity(
+                symbol, gemini_prices.get(symbol), rh_prices.get(symbol)
+            )
 
             if "error" in opportunity:
                 logger.warning(f"❌ {symbol}: {opportunity['error']}")
@@ -317,15 +517,18 @@ class CryptoArbitrageBot:
         """
         logger.info(f"Starting {duration_minutes} minute monitoring cycle...")
 
-        start_time = time.time()
+        end_time = time.time() + duration_minutes * 60
         cycle_count = 0
 
-        while (time.time() - start_time) < (duration_minutes * 60):
+        while time.time() < end_time:
             cycle_count += 1
             logger.info(f"\n=== Monitoring Cycle {cycle_count} ===")
 
             try:
-                opportunities = self.monitor_arbitrage_opportunities()
+                # Cleared before scanning so moves seen mid-scan still
+                # trigger the next one
+                self._prices_moved.clear()
+                opportunities = asyncio.run(self.monitor_arbitrage_opportunities())
 
                 # Summary
                 profitable_ops = [
@@ -335,9 +538,15 @@ class CryptoArbitrageBot:
                     f"\n📋 Cycle Summary: {len(profitable_ops)}/{len(opportunities)} profitable opportunities"
                 )
 
-                # Wait before next cycle
+                # Rescan as soon as the price feed sees a meaningful move.
+                # While prices are flat, still rescan once the snapshot is
+                # max_quote_age old. Without a running feed nothing sets
+                # the event, so scan every 30 seconds.
                 logger.info("⏱️  Waiting for next scan...")
-                time.sleep(30)  # 30 seconds between scans
+                remaining = min(end_time - time.time(), self.max_quote_age)
+                if not (self._price_feed and self._price_feed.is_alive()):
+                    remaining = min(remaining, 30)
+                self._prices_moved.wait(max(remaining, 0))
 
             except KeyboardInterrupt:
                 logger.info("\n👋 Monitoring stopped by user.")
@@ -374,10 +583,13 @@ class CryptoArbitrageBot:
                 logger.info("     No crypto positions found")
 
         # Run monitoring
+        self.start_price_feed()
         try:
             self.run_monitoring_cycle(duration_minutes=60)
         except Exception as e:
             logger.error(f"Error running bot: {e}")
+        finally:
+            self.close()
 
         logger.info("\n👋 Arbitrage bot finished.")
 
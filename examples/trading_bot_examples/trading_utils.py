@@ -0,0 +1,183 @@
+"""
+Building blocks shared by the example trading bots.
+
+Kept free of import-time side effects, unlike the bot scripts, so the tests
+can import them.
+"""
+
+import threading
+import time
+from array import array
+from dataclasses import dataclass, field
+from decimal import Decimal
+from itertools import accumulate
+from typing import Optional
+
+
+class RollingMA:
+    """
+    Short and long simple moving averages over a circular buffer of closes.
+
+    Each push updates both running sums in O(1) instead of re-summing the
+    whole window.
+    """
+
+    __slots__ = ("buf", "filled", "i", "long_k", "long_sum", "short_k", "short_sum")
+
+    def __init__(self, short_k: int, long_k: int):
+        self.buf = array("d", [0.0]) * long_k
+        self.i = 0
+        self.filled = 0
+        self.short_k = short_k
+        self.long_k = long_k
+        self.short_sum = 0.0
+        self.long_sum = 0.0
+
+    @classmethod
+    def from_closes(cls, closes, short_k: int, long_k: int) -> "RollingMA":
+        """
+        Build a full window from the last ``long_k`` closes.
+
+        Both running sums come from a single cumulative-sum pass over the
+        window instead of pushing each close or summing it twice.
+
+        Args:
+            closes: At least ``long_k`` closing prices, oldest first
+            short_k: Short moving average period
+            long_k: Long moving average period
+        """
+        ma = cls(short_k, long_k)
+        ma.buf = array("d", closes)[-long_k:]
+        totals = list(accumulate(ma.buf))
+        ma.long_sum = totals[-1]
+        ma.short_sum = totals[-1] - (totals[-short_k - 1] if short_k < long_k else 0.0)
+        ma.filled = long_k
+        return ma
+
+    def push(self, price: float):
+        """Add the newest close, dropping the oldest once the window is full."""
+        # Runs once per tick, so read each attribute once into a local
+        buf = self.buf
+        i = self.i
+        long_k = self.long_k
+        leaving_short = buf[i - self.short_k]  # negative index wraps around
+        leaving_long = buf[i]
+        buf[i] = price
+        self.short_sum += price - leaving_short
+        self.long_sum += price - leaving_long
+        i += 1
+        self.i = 0 if i == long_k else i
+        if self.filled < long_k:
+            self.filled += 1
+
+    def values(self) -> tuple[Optional[float], Optional[float], Optional[float]]:
+        """
+        Returns:
+            tuple: (short MA, long MA, latest close), all None until the
+            window is full
+        """
+        if self.filled < self.long_k:
+            return None, None, None
+        return (
+            self.short_sum / self.short_k,
+            self.long_sum / self.long_k,
+            self.buf[self.i - 1],
+        )
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket rate limiter.
+
+    Admits bursts of up to ``capacity`` calls and refills at ``rate`` tokens
+    per second, so callers only block once the bucket is empty.
+    """
+
+    def __init__(self, rate: float, capacity: int):
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = float(capacity)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """Take one token, waiting for the bucket to refill if it is empty."""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(
+                    self.capacity, self._tokens + (now - self._updated) * self.rate
+                )
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self.rate
+            time.sleep(wait)
+
+
+@dataclass
+class PriceCache:
+    """
+    Latest bid/ask per symbol for one exchange, stamped with when it arrived.
+    """
+
+    quotes: dict = field(default_factory=dict)
+    # Bid/ask per symbol as of the last scan, which moves are measured from
+    baseline: dict = field(default_factory=dict)
+    # Relative bid/ask change that counts as the market moving
+    move_threshold: Decimal = Decimal(0)
+
+    def update(self, symbol: str, bid: Decimal, ask: Decimal) -> bool:
+        """
+        Store a fresh quote for a symbol.
+
+        Returns:
+            bool: True if the symbol has no baseline yet or its bid or ask
+            moved by more than move_threshold since the last rebase()
+        """
+        self.quotes[symbol] = (bid, ask, time.monotonic())
+        base = self.baseline.get(symbol)
+        if base is None:
+            return True
+        base_bid, base_ask = base
+        return (
+            abs(bid - base_bid) > base_bid * self.move_threshold
+            or abs(ask - base_ask) > base_ask * self.move_threshold
+        )
+
+    def rebase(self):
+        """Measure later moves from the current quotes, once per scan."""
+        # Copy the items first, since the price feed may add symbols meanwhile
+        self.baseline = {
+            symbol: (bid, ask) for symbol, (bid, ask, _) in list(self.quotes.items())
+        }
+
+    def mid(self, symbol: str, max_age: float) -> Optional[Decimal]:
+        """
+        Get the mid price for a symbol.
+
+        Returns:
+            Decimal: Mid price, or None if there is no quote or it is older
+            than max_age seconds
+        """
+        quote = self.quotes.get(symbol)
+        if quote is None or time.monotonic() - quote[2] > max_age:
+            return None
+        bid, ask, _ = quote
+        return (bid + ask) / 2
+
+    def mids(self, max_age: float) -> dict:
+        """
+        Get the mid price of every symbol with a fresh quote.
+
+        Returns:
+            dict: Symbol -> mid price, leaving out quotes older than max_age
+        """
+        cutoff = time.monotonic() - max_age
+        # Copy the items first, since the price feed may add symbols meanwhile
+        return {
+            symbol: (bid + ask) / 2
+            for symbol, (bid, ask, received) in list(self.quotes.items())
+            if received >= cutoff
+        }
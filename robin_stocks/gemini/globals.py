@@ -1,6 +1,8 @@
 """Holds the session header and other global variables."""
 
 from requests import Session
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 NONCE = 1  # Counter that must always be increasing
 LOGGED_IN = False  # Flag on whether or not the user is logged in.
@@ -17,3 +19,14 @@ SESSION.headers = {
     "Content-Length": "0",
     "Cache-Control": "no-cache",
 }
+# Keep enough pooled connections per host for concurrent callers, so requests
+# reuse an open TLS connection instead of handshaking again. Connection errors
+# on a stale keep-alive socket are retried briefly.
+SESSION.mount(
+    "https://",
+    HTTPAdapter(
+        pool_connections=8,
+        pool_maxsize=16,
+        max_retries=Retry(total=2, backoff_factor=0.1),
+    ),
+)
@@ -12,6 +12,11 @@ from robin_stocks.gemini.globals import (
     USE_SANDBOX_URLS,
 )
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 
 def increment_nonce():
     """Increase nonce by one."""
@@ -123,6 +128,19 @@ def login_required(func):
     return login_wrapper
 
 
+def load_json(response):
+    """Parses a response body as JSON, using orjson if it is installed.
+
+    :param response: The response returned by the session.
+    :type response: requests.Response
+    :returns: The parsed JSON data.
+
+    """
+    if orjson is None:
+        return response.json()
+    return orjson.loads(response.content)
+
+
 def request_get(url, payload, parse_json):
     """ Generic function for sending a get request.
 
@@ -146,7 +164,7 @@ def request_get(url, payload, parse_json):
     # Return either the raw request object so you can call response.text, response.status_code, response.headers, or response.json()
     # or return the JSON parsed information if you don't care to check the status codes.
     if parse_json:
-        return response.json(), response_error
+        return load_json(response), response_error
     else:
         return response, response_error
 
@@ -174,6 +192,6 @@ def request_post(url, payload, parse_json):
     # Return either the raw request object so you can call response.text, response.status_code, response.headers, or response.json()
     # or return the JSON parsed information if you don't care to check the status codes.
     if parse_json:
-        return response.json(), response_error
+        return load_json(response), response_error
     else:
         return response, response_error
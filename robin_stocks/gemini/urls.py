@@ -1,7 +1,6 @@
 """Module contains all the API endpoints"""
 
 from enum import Enum, auto
-from re import IGNORECASE, match, split
 
 from robin_stocks.gemini.helper import get_sandbox_flag
 
@@ -25,6 +24,11 @@ class URLS:
 
     __base_url = "https://api.gemini.com"
     __base_sandbox_url = "https://api.sandbox.gemini.com"
+    # Versioned bases are built once here rather than on every url call
+    __v1_url = __base_url + "/v1/"
+    __v2_url = __base_url + "/v2/"
+    __sandbox_v1_url = __base_sandbox_url + "/v1/"
+    __sandbox_v2_url = __base_sandbox_url + "/v2/"
 
     def __init__(self):
         raise NotImplementedError(
@@ -33,20 +37,21 @@ class URLS:
 
     @classmethod
     def get_base_url(cls, version):
-        url = cls.__base_sandbox_url if get_sandbox_flag() else cls.__base_url
+        if get_sandbox_flag():
+            return (
+                cls.__sandbox_v1_url if version is Version.v1 else cls.__sandbox_v2_url
+            )
 
-        return url + "/" + version.value + "/"
+        return cls.__v1_url if version is Version.v1 else cls.__v2_url
 
     @classmethod
     def get_endpoint(cls, url):
-        if match(cls.__base_sandbox_url, url, IGNORECASE):
-            _, end = split(cls.__base_sandbox_url, url, flags=IGNORECASE)
-        elif match(cls.__base_url, url, IGNORECASE):
-            _, end = split(cls.__base_url, url, flags=IGNORECASE)
-        else:
-            raise ValueError("The URL has the wrong base.")
-
-        return end
+        # Base urls are lowercase, so compare against a lowercased prefix
+        for base in (cls.__base_sandbox_url, cls.__base_url):
+            if url[: len(base)].lower() == base:
+                return url[len(base) :]
+
+        raise ValueError("The URL has the wrong base.")
 
     # account.py
     @classmethod
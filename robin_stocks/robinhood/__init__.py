@@ -41,6 +41,7 @@ from .crypto import (
     get_crypto_positions,
     get_crypto_quote,
     get_crypto_quote_from_id,
+    get_crypto_quotes,
     load_crypto_profile,
 )
 from .export import (
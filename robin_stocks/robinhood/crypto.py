@@ -180,6 +180,42 @@ def get_crypto_quote_from_id(id, info=None):
     return filter_data(data, info)
 
 
+@login_required
+def get_crypto_quotes(inputSymbols, info=None):
+    """Takes any number of crypto tickers and returns their quotes from a single request.
+
+    :param inputSymbols: May be a single crypto ticker or a list of crypto tickers.
+    :type inputSymbols: str or list
+    :param info: Will filter the results to have a list of the values that correspond to key that matches info.
+    :type info: Optional[str]
+    :returns: [list] If info parameter is left as None then the list will contain a dictionary of key/value pairs for each ticker. \
+    Otherwise, it will be a list of strings where the strings are the values of the key that corresponds to info.
+    :Dictionary Keys: * ask_price
+                      * bid_price
+                      * high_price
+                      * id
+                      * low_price
+                      * mark_price
+                      * open_price
+                      * symbol
+                      * volume
+
+    """
+    symbols = inputs_to_set(inputSymbols)
+    ids = [id for id in (get_crypto_id(symbol) for symbol in symbols) if id]
+    if not ids:
+        return None
+
+    url = crypto_quotes_url()
+    payload = {"ids": ",".join(ids)}
+    data = request_get(url, "results", payload)
+    if data is None or data == [None]:
+        return data
+
+    data = [item for item in data if item is not None]
+    return filter_data(data, info)
+
+
 @login_required
 def get_crypto_historicals(
     symbol, interval="hour", span="week", bounds="24_7", info=None
@@ -3,6 +3,8 @@
 import sys
 
 from requests import Session
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 # Keeps track on if the user is logged in or not.
 LOGGED_IN = False
@@ -17,6 +19,17 @@ SESSION.headers = {
     "Connection": "keep-alive",
     "User-Agent": "*",
 }
+# Keep enough pooled connections per host for concurrent callers, so requests
+# reuse an open TLS connection instead of handshaking again. Connection errors
+# on a stale keep-alive socket are retried briefly.
+SESSION.mount(
+    "https://",
+    HTTPAdapter(
+        pool_connections=8,
+        pool_maxsize=16,
+        max_retries=Retry(total=2, backoff_factor=0.1),
+    ),
+)
 
 # All print() statement direct their output to this stream
 # by default, we use stdout which is the existing behavior
@@ -6,6 +6,11 @@ import requests
 
 from robin_stocks.robinhood.globals import LOGGED_IN, OUTPUT, SESSION
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 
 def set_login_state(logged_in):
     """Sets the login state"""
@@ -53,8 +58,13 @@ def convert_none_to_string(func):
     return string_wrapper
 
 
+SYMBOL_TO_STOCK_ID_CACHE = {}
+SYMBOL_TO_CHAIN_ID_CACHE = {}
+
+
 def id_for_stock(symbol):
     """Takes a stock ticker and returns the instrument id associated with the stock.
+    This function uses an in-memory cache of the IDs to save a network round-trip when possible.
 
     :param symbol: The symbol to get the id for.
     :type symbol: str
@@ -67,15 +77,22 @@ def id_for_stock(symbol):
         print(message, file=get_output())
         return None
 
+    if symbol in SYMBOL_TO_STOCK_ID_CACHE:
+        return SYMBOL_TO_STOCK_ID_CACHE[symbol]
+
     url = "https://api.robinhood.com/instruments/"
     payload = {"symbol": symbol}
     data = request_get(url, "indexzero", payload)
 
-    return filter_data(data, "id")
+    id = filter_data(data, "id")
+    if id:
+        SYMBOL_TO_STOCK_ID_CACHE[symbol] = id
+    return id
 
 
 def id_for_chain(symbol):
     """Takes a stock ticker and returns the chain id associated with a stocks option.
+    This function uses an in-memory cache of the IDs to save a network round-trip when possible.
 
     :param symbol: The symbol to get the id for.
     :type symbol: str
@@ -88,13 +105,19 @@ def id_for_chain(symbol):
         print(message, file=get_output())
         return None
 
+    if symbol in SYMBOL_TO_CHAIN_ID_CACHE:
+        return SYMBOL_TO_CHAIN_ID_CACHE[symbol]
+
     url = "https://api.robinhood.com/instruments/"
 
     payload = {"symbol": symbol}
     data = request_get(url, "indexzero", payload)
 
     if data:
-        return data["tradable_chain_id"]
+        chain_id = data["tradable_chain_id"]
+        if chain_id:
+            SYMBOL_TO_CHAIN_ID_CACHE[symbol] = chain_id
+        return chain_id
     else:
         return data
 
@@ -243,6 +266,20 @@ def inputs_to_set(inputSymbols):
     return symbols_list
 
 
+def parse_json(response):
+    """Parses the body of a response as JSON. Uses orjson when it is installed,
+    which is much faster than the standard library for large payloads.
+
+    :param response: The response returned by the session.
+    :type response: requests.Response
+    :returns: The parsed JSON data.
+
+    """
+    if orjson is None:
+        return response.json()
+    return orjson.loads(response.content)
+
+
 def request_document(url, payload=None):
     """Using a document url, makes a get request and returnes the session data.
 
@@ -284,7 +321,7 @@ def request_get(url, dataType="regular", payload=None, jsonify_data=True):
         try:
             res = SESSION.get(url, params=payload)
             res.raise_for_status()
-            data = res.json()
+            data = parse_json(res)
         except (requests.exceptions.HTTPError, AttributeError) as message:
             print(message, file=get_output())
             return data
@@ -313,7 +350,7 @@ def request_get(url, dataType="regular", payload=None, jsonify_data=True):
             try:
                 res = SESSION.get(nextData["next"])
                 res.raise_for_status()
-                nextData = res.json()
+                nextData = parse_json(res)
             except:
                 print(
                     "Additional pages exist but could not be loaded.", file=get_output()
@@ -378,7 +415,7 @@ def request_post(url, payload=None, timeout=16, json=False, jsonify_data=True):
             403,
         ]:
             raise Exception("Received " + str(res.status_code))
-        data = res.json()
+        data = parse_json(res)
     except Exception as message:
         print(f"Error in request_post: {message}", file=get_output())
     if jsonify_data:
@@ -1,5 +1,8 @@
 """Contains all the url endpoints for interacting with Robinhood API."""
 
+from functools import lru_cache
+from urllib.parse import urlencode
+
 from robin_stocks.robinhood.helper import id_for_chain, id_for_stock
 
 # Login
@@ -73,6 +76,7 @@ def instruments_url():
     return "https://api.robinhood.com/instruments/"
 
 
+@lru_cache(maxsize=256)
 def news_url(symbol):
     return f"https://api.robinhood.com/midlands/news/{symbol}/?"
 
@@ -237,6 +241,7 @@ def chains_url(symbol):
     return f"https://api.robinhood.com/options/chains/{id_for_chain(symbol)}/"
 
 
+@lru_cache(maxsize=256)
 def option_historicals_url(id):
     return f"https://api.robinhood.com/marketdata/options/historicals/{id}/"
 
@@ -252,18 +257,14 @@ def option_orders_url(orderID=None, account_number=None, start_date=None):
     url = "https://api.robinhood.com/options/orders/"
     if orderID:
         url += f"{orderID}/"
-    query_build = []
+    params = {}
     if account_number:
-        query_build.append(f"account_numbers={account_number}")
+        params["account_numbers"] = account_number
     if start_date:
-        query_build.append(f"updated_at[gte]={start_date}")
+        params["updated_at[gte]"] = start_date
 
-    if query_build:
-        for index, value in enumerate(query_build):
-            if index == 0:
-                url += "?" + value
-            else:
-                url += "&" + value
+    if params:
+        url += "?" + urlencode(params, safe="[]")
 
     return url
 
@@ -285,10 +286,12 @@ def marketdata_options_url():
 # pricebook
 
 
+@lru_cache(maxsize=256)
 def marketdata_quotes_url(id):
     return f"https://api.robinhood.com/marketdata/quotes/{id}/"
 
 
+@lru_cache(maxsize=256)
 def marketdata_pricebook_url(id):
     return f"https://api.robinhood.com/marketdata/pricebook/snapshots/{id}/"
 
@@ -308,14 +311,20 @@ def crypto_currency_pairs_url():
     return "https://nummus.robinhood.com/currency_pairs/"
 
 
+@lru_cache(maxsize=256)
 def crypto_quote_url(id):
     return f"https://api.robinhood.com/marketdata/forex/quotes/{id}/"
 
 
+def crypto_quotes_url():
+    return "https://api.robinhood.com/marketdata/forex/quotes/"
+
+
 def crypto_holdings_url():
     return "https://nummus.robinhood.com/holdings/"
 
 
+@lru_cache(maxsize=256)
 def crypto_historical_url(id):
     return f"https://api.robinhood.com/marketdata/forex/historicals/{id}/"
 
@@ -347,17 +356,13 @@ def orders_url(orderID=None, account_number=None, start_date=None):
     if orderID:
         url += f"{orderID}/"
 
-    query_build = []
+    params = {}
     if account_number:
-        query_build.append(f"account_numbers={account_number}")
+        params["account_numbers"] = account_number
     if start_date:
-        query_build.append(f"updated_at[gte]={start_date}")
-
-    if query_build:
-        for index, value in enumerate(query_build):
-            if index == 0:
-                url += "?" + value
-            else:
-                url += "&" + value
+        params["updated_at[gte]"] = start_date
+
+    if params:
+        url += "?" + urlencode(params, safe="[]")
 
     return url
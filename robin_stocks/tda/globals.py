@@ -1,6 +1,8 @@
 """Holds the session header and other global variables."""
 
 from requests import Session
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 DATA_DIR_NAME = ".tokens"
 PICKLE_NAME = "tda.pickle"
@@ -24,3 +26,14 @@ SESSION.headers = {
     "Sec-Fetch-Mode": "cors",
     "Sec-Fetch-Site": "same-site",
 }
+# Keep enough pooled connections per host for concurrent callers, so requests
+# reuse an open TLS connection instead of handshaking again. Connection errors
+# on a stale keep-alive socket are retried briefly.
+SESSION.mount(
+    "https://",
+    HTTPAdapter(
+        pool_connections=8,
+        pool_maxsize=16,
+        max_retries=Retry(total=2, backoff_factor=0.1),
+    ),
+)
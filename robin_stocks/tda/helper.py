@@ -7,6 +7,11 @@ import requests
 
 from robin_stocks.tda.globals import LOGGED_IN, RETURN_PARSED_JSON_RESPONSE, SESSION
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 
 def get_order_number(data):
     """Gets the"""
@@ -99,6 +104,19 @@ def login_required(func):
     return login_wrapper
 
 
+def load_json(response):
+    """Parses a response body as JSON, using orjson if it is installed.
+
+    :param response: The response returned by the session.
+    :type response: requests.Response
+    :returns: The parsed JSON data.
+
+    """
+    if orjson is None:
+        return response.json()
+    return orjson.loads(response.content)
+
+
 def request_get(url, payload, parse_json):
     """ Generic function for sending a get request.
 
@@ -122,7 +140,7 @@ def request_get(url, payload, parse_json):
     # Return either the raw request object so you can call response.text, response.status_code, response.headers, or response.json()
     # or return the JSON parsed information if you don't care to check the status codes.
     if parse_json:
-        return response.json(), response_error
+        return load_json(response), response_error
     else:
         return response, response_error
 
@@ -150,7 +168,7 @@ def request_post(url, payload, parse_json):
     # Return either the raw request object so you can call response.text, response.status_code, response.headers, or response.json()
     # or return the JSON parsed information if you don't care to check the status codes.
     if parse_json:
-        return response.json(), response_error
+        return load_json(response), response_error
     else:
         return response, response_error
 
@@ -178,7 +196,7 @@ def request_data(url, payload, parse_json):
     # Return either the raw request object so you can call response.text, response.status_code, response.headers, or response.json()
     # or return the JSON parsed information if you don't care to check the status codes.
     if parse_json:
-        return response.json(), response_error
+        return load_json(response), response_error
     else:
         return response, response_error
 
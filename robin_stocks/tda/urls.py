@@ -1,7 +1,6 @@
 """Module contains all the API endpoints"""
 
 from enum import Enum, auto
-from re import IGNORECASE, match, split
 
 
 class AutoName(Enum):
@@ -22,6 +21,9 @@ class URLS:
     """Static class for holding all urls."""
 
     __base_url = "https://api.tdameritrade.com"
+    # Versioned bases are built once here rather than on every url call
+    __v1_url = __base_url + "/v1/"
+    __v2_url = __base_url + "/v2/"
 
     def __init__(self):
         raise NotImplementedError(
@@ -30,84 +32,81 @@ class URLS:
 
     @classmethod
     def get_base_url(cls, version):
-        return cls.__base_url + "/" + version.value + "/"
+        return cls.__v1_url if version is Version.v1 else cls.__v2_url
 
     @classmethod
     def get_endpoint(cls, url):
-        if match(cls.__base_url, url, IGNORECASE):
-            _, end = split(cls.__base_url, url, flags=IGNORECASE)
-        else:
+        base_length = len(cls.__base_url)
+        if url[:base_length].lower() != cls.__base_url:
             raise ValueError("The URL has the wrong base.")
 
-        return end
+        return url[base_length:]
 
     # accounts.py
     @classmethod
     def account(cls, id):
-        return cls.get_base_url(Version.v1) + f"accounts/{id}"
+        return cls.__v1_url + f"accounts/{id}"
 
     @classmethod
     def accounts(cls):
-        return cls.get_base_url(Version.v1) + "accounts"
+        return cls.__v1_url + "accounts"
 
     @classmethod
     def transaction(cls, id, transaction):
-        return (
-            cls.get_base_url(Version.v1) + f"accounts/{id}/transactions/{transaction}"
-        )
+        return cls.__v1_url + f"accounts/{id}/transactions/{transaction}"
 
     @classmethod
     def transactions(cls, id):
-        return cls.get_base_url(Version.v1) + f"accounts/{id}/transactions"
+        return cls.__v1_url + f"accounts/{id}/transactions"
 
     # authentication.py
     @classmethod
     def oauth(cls):
-        return cls.get_base_url(Version.v1) + "oauth2/token"
+        return cls.__v1_url + "oauth2/token"
 
     # markets.py
     @classmethod
     def markets(cls):
-        return cls.get_base_url(Version.v1) + "marketdata/hours"
+        return cls.__v1_url + "marketdata/hours"
 
     @classmethod
     def market(cls, market):
-        return cls.get_base_url(Version.v1) + f"marketdata/{market}/hours"
+        return cls.__v1_url + f"marketdata/{market}/hours"
 
     @classmethod
     def movers(cls, index):
-        return cls.get_base_url(Version.v1) + f"marketdata/{index}/movers"
+        return cls.__v1_url + f"marketdata/{index}/movers"
 
     # orders.py
     @classmethod
     def orders(cls, account_id):
-        return cls.get_base_url(Version.v1) + f"accounts/{account_id}/orders"
+        return cls.__v1_url + f"accounts/{account_id}/orders"
 
     @classmethod
     def order(cls, account_id, order_id):
-        return cls.get_base_url(Version.v1) + f"accounts/{account_id}/orders/{order_id}"
+        return cls.__v1_url + f"accounts/{account_id}/orders/{order_id}"
 
     # stocks.py
     @classmethod
     def instruments(cls):
-        return cls.get_base_url(Version.v1) + "instruments"
+        return cls.__v1_url + "instruments"
 
     @classmethod
     def instrument(cls, cusip):
-        return cls.get_base_url(Version.v1) + f"instruments/{cusip}"
+        return cls.__v1_url + f"instruments/{cusip}"
 
     @classmethod
     def quote(cls, ticker):
-        return cls.get_base_url(Version.v1) + f"marketdata/{ticker}/quotes"
+        return cls.__v1_url + f"marketdata/{ticker}/quotes"
 
     @classmethod
     def quotes(cls):
-        return cls.get_base_url(Version.v1) + "marketdata/quotes"
+        return cls.__v1_url + "marketdata/quotes"
 
     @classmethod
     def price_history(cls, ticker):
-        return cls.get_base_url(Version.v1) + f"marketdata/{ticker}/pricehistory"
+        return cls.__v1_url + f"marketdata/{ticker}/pricehistory"
 
     @classmethod
     def option_chains(cls):
-        return cls.get_base_url(Version.v1) + "marketdata/chains"
+        return cls.__v1_url + "marketdata/chains"
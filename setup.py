@@ -30,5 +30,6 @@ setup(
     packages=find_packages(),
     requires=["requests", "pyotp", "cryptography"],
     install_requires=["requests", "pyotp", "python-dotenv", "cryptography"],
+    extras_require={"fast": ["orjson"]},
     zip_safe=False,
 )
@@ -0,0 +1,64 @@
+import os
+
+import pytest
+from dotenv import load_dotenv
+
+import robin_stocks.gemini as g
+import robin_stocks.gemini.globals
+import robin_stocks.robinhood.globals
+import robin_stocks.tda.globals
+
+# Read .env once, before any test module is imported
+load_dotenv()
+
+GEMINI_ACCOUNT_KEY = os.environ.get("GEMINI_ACCOUNT_KEY")
+GEMINI_ACCOUNT_SECRET = os.environ.get("GEMINI_ACCOUNT_SECRET")
+GEMINI_SANDBOX_KEY = os.environ.get("GEMINI_SANDBOX_KEY")
+GEMINI_SANDBOX_SECRET = os.environ.get("GEMINI_SANDBOX_SECRET")
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--run-live",
+        action="store_true",
+        help="run tests that call the real APIs (needs credentials in .env)",
+    )
+
+
+def pytest_collection_modifyitems(config, items):
+    if config.getoption("--run-live"):
+        return
+    skip_live = pytest.mark.skip(reason="calls the real APIs, use --run-live to run")
+    for item in items:
+        if "live" in item.keywords:
+            item.add_marker(skip_live)
+
+
+@pytest.fixture(scope="session", autouse=True)
+def pooled_sessions():
+    """Close each API's pooled connections once the test run is over."""
+    yield
+    for api in (robin_stocks.gemini, robin_stocks.robinhood, robin_stocks.tda):
+        api.globals.SESSION.close()
+
+
+@pytest.fixture(scope="session")
+def gemini_session():
+    """Log in to Gemini once and share the session across the test run."""
+    if not (GEMINI_ACCOUNT_KEY and GEMINI_ACCOUNT_SECRET):
+        pytest.skip("Gemini account credentials are not set")
+    g.login(GEMINI_ACCOUNT_KEY, GEMINI_ACCOUNT_SECRET)
+    yield
+    g.logout()
+
+
+@pytest.fixture(scope="class")
+def gemini_sandbox_session(gemini_session):
+    """Switch the shared Gemini session to the sandbox for one test class."""
+    if not (GEMINI_SANDBOX_KEY and GEMINI_SANDBOX_SECRET):
+        pytest.skip("Gemini sandbox credentials are not set")
+    g.use_sand_box_urls(True)
+    g.login(GEMINI_SANDBOX_KEY, GEMINI_SANDBOX_SECRET)
+    yield
+    g.use_sand_box_urls(False)
+    g.login(GEMINI_ACCOUNT_KEY, GEMINI_ACCOUNT_SECRET)
@@ -1,37 +1,45 @@
-import os
+from concurrent.futures import ThreadPoolExecutor
 
-from dotenv import load_dotenv
+import pytest
 
 import robin_stocks.gemini as g
+from robin_stocks.gemini.helper import load_json
 
-load_dotenv()
+pytestmark = [pytest.mark.live, pytest.mark.usefixtures("gemini_session")]
+
+
+def heartbeat_ok():
+    response, err = g.heartbeat()
+    return (
+        err is None
+        and response.status_code == 200
+        and load_json(response)["result"] == "ok"
+    )
 
 
 class TestAuthentication:
-    def test_login(self):
-        g.login(os.environ["GEMINI_ACCOUNT_KEY"], os.environ["GEMINI_ACCOUNT_SECRET"])
-        assert g.get_login_state()
+    @pytest.mark.parametrize(
+        "check", [g.get_login_state, heartbeat_ok], ids=["login", "heartbeat"]
+    )
+    def test_session(self, check):
+        assert check()
 
-    def test_logout(self):
-        g.login(os.environ["GEMINI_ACCOUNT_KEY"], os.environ["GEMINI_ACCOUNT_SECRET"])
-        g.logout()
-        assert not g.get_login_state()
 
-    def test_heartbeat(self):
-        g.login(os.environ["GEMINI_ACCOUNT_KEY"], os.environ["GEMINI_ACCOUNT_SECRET"])
-        response, err = g.heartbeat()
-        data = response.json()
-        assert err is None
-        assert response.status_code == 200
-        assert data["result"] == "ok"
+@pytest.fixture(scope="class")
+def crypto_snapshot():
+    """Fetch the btcusd ticker and the symbol list at the same time, once."""
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        pubticker = executor.submit(g.get_pubticker, TestCrypto.ticker)
+        symbols = executor.submit(g.get_symbols)
+        return pubticker.result(), symbols.result()
 
 
 class TestCrypto:
     ticker = "btcusd"
 
-    def test_pubticker_btc(self):
-        response, err = g.get_pubticker(self.ticker)
-        data = response.json()
+    def test_pubticker_btc(self, crypto_snapshot):
+        response, err = crypto_snapshot[0]
+        data = load_json(response)
         assert err is None
         assert response.status_code == 200
         assert "bid" in data
@@ -39,27 +47,19 @@ class TestCrypto:
         assert "volume" in data
         assert "last" in data
 
-    def test_get_symbols(self):
-        response, err = g.get_symbols()
-        data = response.json()
+    def test_get_symbols(self, crypto_snapshot):
+        response, err = crypto_snapshot[1]
+        data = load_json(response)
         assert err is None
         assert response.status_code == 200
         assert len(data) > 1
         assert self.ticker in data
 
 
+@pytest.mark.usefixtures("gemini_sandbox_session")
 class TestOrders:
     ticker = "ethusd"
 
-    @classmethod
-    def setup_class(cls):
-        g.use_sand_box_urls(True)
-        g.login(os.environ["GEMINI_SANDBOX_KEY"], os.environ["GEMINI_SANDBOX_SECRET"])
-
-    @classmethod
-    def teardown_class(cls):
-        g.use_sand_box_urls(False)
-
     def test_mytrades(self):
         response, err = g.get_trades_for_crypto("btcusd")
         assert err is None
@@ -67,11 +67,15 @@ class TestOrders:
 
 
 class TestAccount:
-    @classmethod
-    def setup_class(cls):
-        g.login(os.environ["GEMINI_ACCOUNT_KEY"], os.environ["GEMINI_ACCOUNT_SECRET"])
-
     def test_account_detail(self):
         response, err = g.get_account_detail()
         assert err is None
         assert response.status_code == 200
+
+
+class TestLogout:
+    """Kept last in the module, since logging out ends the shared session."""
+
+    def test_logout(self):
+        g.logout()
+        assert not g.get_login_state()
@@ -9,6 +9,8 @@ from dateutil.relativedelta import relativedelta
 
 import robin_stocks.robinhood as r
 
+pytestmark = pytest.mark.live
+
 
 def third_friday(year, month, day):
     """Return datetime.date for monthly option expiration given year and
@@ -317,7 +319,7 @@ class TestCrypto:
     bitcoin_currency = "BTC-USD"
     bitcoin_symbol = "BTCUSD"
     fake = "thisisafake"
-    account = os.environ["CRYPTO_ACCOUNT"]
+    account = os.environ.get("CRYPTO_ACCOUNT")
 
     @classmethod
     def setup_class(cls):
@@ -429,16 +431,9 @@ class TestCrypto:
 
 
 class TestOptions:
-    # have to login to use round_up_price
-    totp = pyotp.TOTP(os.environ["ROBIN_MFA"]).now()
-    login = r.login(
-        os.environ["ROBIN_USERNAME"], os.environ["ROBIN_PASSWORD"], mfa_code=totp
-    )
-    #
     now = datetime.datetime.now() + relativedelta(months=1)
     expiration_date = third_friday(now.year, now.month, now.day).strftime("%Y-%m-%d")
     symbol = "AAPL"
-    strike = round_up_price(symbol, 10)
 
     @classmethod
     def setup_class(cls):
@@ -446,6 +441,8 @@ class TestOptions:
         r.login(
             os.environ["ROBIN_USERNAME"], os.environ["ROBIN_PASSWORD"], mfa_code=totp
         )
+        # have to login to use round_up_price
+        cls.strike = round_up_price(cls.symbol, 10)
 
     @classmethod
     def teardown_class(cls):
@@ -1,10 +1,11 @@
 import os
 
-from dotenv import load_dotenv
+import pytest
 
 import robin_stocks.tda as t
+from robin_stocks.tda.helper import load_json
 
-load_dotenv()
+pytestmark = pytest.mark.live
 
 
 class TestAuthentication:
@@ -13,16 +14,22 @@ class TestAuthentication:
         assert t.get_login_state()
 
 
+@pytest.fixture(scope="class")
+def quotes():
+    """Quote every TestStocks ticker in a single request, shared by the class."""
+    resp, err = t.get_quotes(",".join(TestStocks.tickers))
+    assert resp.status_code == 200
+    assert err is None
+    return load_json(resp)
+
+
 class TestStocks:
-    ticker = "TSLA"
+    tickers = ("TSLA", "AAPL", "MSFT", "SPY")
 
     @classmethod
     def setup_class(cls):
         t.login(os.environ["TDA_ENCRYPTION_PASSCODE"])
 
-    def test_quote(self):
-        resp, err = t.get_quote(self.ticker)
-        data = resp.json()
-        assert resp.status_code == 200
-        assert err is None
-        assert self.ticker in data
+    @pytest.mark.parametrize("ticker", tickers)
+    def test_quote(self, quotes, ticker):
+        assert ticker in quotes
@@ -3,19 +3,41 @@ Integration tests for trading bot functionality.
 These tests focus on trading bot use cases and strategies.
 """
 
+from decimal import Decimal
+from operator import itemgetter
+from statistics import fmean
+from types import MappingProxyType
 from unittest.mock import Mock, patch
 
 import pytest
+import trading_utils
+from trading_utils import PriceCache, RollingMA, TokenBucket
 
 import robin_stocks.gemini as gem
 import robin_stocks.robinhood as rh
 import robin_stocks.tda as tda
 
+# Read-only historical close prices, shared by the market data tests
+_HIST_PRICES = tuple(
+    MappingProxyType({"close_price": price})
+    for price in ("100.00", "102.00", "101.00", "103.00", "105.00")
+)
+
+
+@pytest.fixture(scope="module")
+def tda_aapl_response():
+    """TDA quote response for AAPL, built once and shared by the module."""
+    response = Mock()
+    response.json.return_value = {"AAPL": {"lastPrice": 150.50}}
+    response.status_code = 200
+    return response
+
 
 class TestTradingBotIntegration:
     """Test trading bot specific functionality."""
 
-    @patch("robin_stocks.robinhood.helper.request_get")
+    @patch("robin_stocks.robinhood.helper.LOGGED_IN", True)
+    @patch("robin_stocks.robinhood.profiles.request_get")
     def test_portfolio_balance_check(self, mock_request):
         """Test checking portfolio balance before trading."""
         mock_request.return_value = {
@@ -24,35 +46,42 @@ class TestTradingBotIntegration:
             "market_value": "10000.00",
         }
 
-        portfolio = rh.get_portfolio()
-        balance = float(portfolio["market_value"])
+        portfolio = rh.load_portfolio_profile()
+        balance = Decimal(portfolio["market_value"])
 
-        assert balance >= 0
-        assert isinstance(balance, float)
+        assert balance == Decimal("10000")
+        mock_request.assert_called_once()
 
-    @patch("robin_stocks.robinhood.helper.request_get")
+    @patch("robin_stocks.robinhood.helper.LOGGED_IN", True)
+    @patch("robin_stocks.robinhood.profiles.request_get")
     def test_risk_management_position_size(self, mock_request):
         """Test position sizing for risk management."""
         # Mock portfolio value
         mock_request.return_value = {"market_value": "10000.00"}
 
-        portfolio_value = float(rh.get_portfolio()["market_value"])
-        max_position_percent = 0.05  # 5% max per position
+        portfolio_value = Decimal(rh.load_portfolio_profile(info="market_value"))
+        max_position_percent = Decimal("0.05")  # 5% max per position
         max_position_value = portfolio_value * max_position_percent
 
-        assert max_position_value == 500.0
+        assert max_position_value == Decimal("500")
         assert max_position_value < portfolio_value
 
-    @patch("robin_stocks.robinhood.helper.request_get")
+    @patch("robin_stocks.robinhood.stocks.request_get")
     def test_stop_loss_calculation(self, mock_request):
         """Test stop loss calculation."""
-        mock_request.return_value = [{"price": "150.00"}]
+        mock_request.return_value = [
+            {
+                "symbol": "AAPL",
+                "last_trade_price": "150.00",
+                "last_extended_hours_trade_price": None,
+            }
+        ]
 
-        current_price = float(rh.get_latest_price("AAPL")[0])
-        stop_loss_percent = 0.02  # 2% stop loss
+        current_price = Decimal(rh.get_latest_price("AAPL")[0])
+        stop_loss_percent = Decimal("0.02")  # 2% stop loss
         stop_loss_price = current_price * (1 - stop_loss_percent)
 
-        assert stop_loss_price == 147.0
+        assert stop_loss_price == Decimal("147")
         assert stop_loss_price < current_price
 
 
@@ -63,20 +92,40 @@ class TestMarketDataAnalysis:
     def test_moving_average_calculation(self, mock_request):
         """Test calculating moving averages from price data."""
         # Mock historical price data
-        mock_request.return_value = [
-            {"close_price": "100.00"},
-            {"close_price": "102.00"},
-            {"close_price": "101.00"},
-            {"close_price": "103.00"},
-            {"close_price": "105.00"},
-        ]
+        mock_request.return_value = _HIST_PRICES
 
-        prices = [float(p["close_price"]) for p in mock_request.return_value]
-        moving_avg = sum(prices) / len(prices)
+        closes = map(itemgetter("close_price"), mock_request.return_value)
+        prices = list(map(float, closes))
+        moving_avg = fmean(prices)
 
         assert moving_avg == 102.2
         assert len(prices) == 5
 
+    def test_rolling_ma_push(self):
+        """Test that pushed closes give the same averages as a fresh window."""
+        closes = [100.0 + (i * 7) % 13 for i in range(50)]
+        ma = RollingMA.from_closes(closes[:20], 10, 20)
+
+        # Push well past the buffer length so the write index wraps around
+        for n in range(21, len(closes) + 1):
+            ma.push(closes[n - 1])
+            short_ma, long_ma, latest = ma.values()
+
+            assert short_ma == pytest.approx(fmean(closes[n - 10 : n]))
+            assert long_ma == pytest.approx(fmean(closes[n - 20 : n]))
+            assert latest == closes[n - 1]
+
+    def test_rolling_ma_not_full(self):
+        """Test that no averages are reported until the window is full."""
+        ma = RollingMA(2, 3)
+        for price in (1.0, 2.0):
+            ma.push(price)
+            assert ma.values() == (None, None, None)
+
+        ma.push(3.0)
+
+        assert ma.values() == (2.5, 2.0, 3.0)
+
     @patch("robin_stocks.gemini.helper.request_get")
     def test_crypto_volatility_check(self, mock_request):
         """Test checking crypto volatility for trading decisions."""
@@ -94,6 +143,90 @@ class TestMarketDataAnalysis:
         assert spread_percent > 0
 
 
+@pytest.fixture
+def clock(monkeypatch):
+    """Fake monotonic clock for trading_utils; sleeping advances it."""
+    now = [1000.0]
+    sleeps = []
+
+    def sleep(seconds):
+        sleeps.append(seconds)
+        now[0] += seconds
+
+    monkeypatch.setattr(trading_utils.time, "monotonic", lambda: now[0])
+    monkeypatch.setattr(trading_utils.time, "sleep", sleep)
+    return now, sleeps
+
+
+class TestRateLimiting:
+    """Test the token bucket shared by the trading bots."""
+
+    def test_burst_then_block(self, clock):
+        """Test that a full bucket admits a burst, then waits for a refill."""
+        _, sleeps = clock
+        bucket = TokenBucket(rate=2.0, capacity=3)
+
+        for _ in range(3):
+            bucket.acquire()
+        assert sleeps == []
+
+        bucket.acquire()
+        assert sleeps == [pytest.approx(0.5)]
+
+    def test_refill_capped_at_capacity(self, clock):
+        """Test that an idle bucket refills to capacity and no further."""
+        now, sleeps = clock
+        bucket = TokenBucket(rate=1.0, capacity=2)
+        bucket.acquire()
+        bucket.acquire()
+
+        now[0] += 60
+        bucket.acquire()
+        bucket.acquire()
+        assert sleeps == []
+
+        bucket.acquire()
+        assert sleeps == [pytest.approx(1.0)]
+
+
+class TestPriceCache:
+    """Test the quote cache that triggers arbitrage rescans."""
+
+    def test_move_threshold(self):
+        """Test that only moves beyond the threshold count."""
+        cache = PriceCache(move_threshold=Decimal("0.01"))
+
+        assert cache.update("btcusd", Decimal("100"), Decimal("101"))
+        cache.rebase()
+        assert not cache.update("btcusd", Decimal("100.5"), Decimal("101.5"))
+        assert cache.update("btcusd", Decimal("98.5"), Decimal("101"))
+
+    def test_drift_measured_from_baseline(self):
+        """Test that small ticks add up against the baseline until a rebase."""
+        cache = PriceCache(move_threshold=Decimal("0.01"))
+        cache.update("btcusd", Decimal("100"), Decimal("101"))
+        cache.rebase()
+
+        ticks = [Decimal("100.4"), Decimal("100.8"), Decimal("101.2")]
+        moved = [cache.update("btcusd", bid, bid + 1) for bid in ticks]
+        assert moved == [False, False, True]
+
+        cache.rebase()
+        assert not cache.update("btcusd", Decimal("101.6"), Decimal("102.6"))
+
+    def test_stale_quotes_dropped(self, clock):
+        """Test that mids leave out quotes older than max_age."""
+        now, _ = clock
+        cache = PriceCache()
+        cache.update("btcusd", Decimal("100"), Decimal("102"))
+        now[0] += 10
+        cache.update("ethusd", Decimal("10"), Decimal("12"))
+
+        assert cache.mid("btcusd", max_age=15) == Decimal("101")
+        assert cache.mids(max_age=5) == {"ethusd": Decimal("11")}
+        assert cache.mid("btcusd", max_age=5) is None
+
+
 class TestOrderManagement:
     """Test order management functionality."""
 
@@ -134,23 +267,29 @@ class TestOrderManagement:
 class TestMultiApiStrategy:
     """Test strategies using multiple APIs."""
 
-    @patch("robin_stocks.robinhood.helper.request_get")
-    @patch("robin_stocks.tda.helper.request_get")
-    def test_price_comparison_arbitrage(self, mock_tda, mock_rh):
+    @patch("robin_stocks.robinhood.stocks.request_get")
+    @patch("robin_stocks.tda.helper.LOGGED_IN", True)
+    @patch("robin_stocks.tda.stocks.request_get")
+    def test_price_comparison_arbitrage(self, mock_tda, mock_rh, tda_aapl_response):
         """Test comparing prices across different platforms."""
         # Mock different prices on different platforms
-        mock_rh.return_value = [{"price": "150.00"}]
-        mock_tda_response = Mock()
-        mock_tda_response.json.return_value = {"AAPL": {"lastPrice": 150.50}}
-        mock_tda_response.status_code = 200
-        mock_tda.return_value = (mock_tda_response, None)
+        mock_rh.return_value = [
+            {
+                "symbol": "AAPL",
+                "last_trade_price": "150.00",
+                "last_extended_hours_trade_price": None,
+            }
+        ]
+        mock_tda.return_value = (tda_aapl_response, None)
 
         rh_price = float(rh.get_latest_price("AAPL")[0])
         tda_response, _ = tda.get_quote("AAPL")
         tda_price = tda_response.json()["AAPL"]["lastPrice"]
 
         price_diff = abs(tda_price - rh_price)
-        assert price_diff >= 0
+        assert price_diff == pytest.approx(0.5)
+        mock_rh.assert_called_once()
+        mock_tda.assert_called_once()
 
     @patch("robin_stocks.gemini.helper.request_get")
     @patch("robin_stocks.robinhood.helper.request_get")
@@ -192,15 +331,17 @@ class TestBacktesting:
 
     def test_performance_metrics(self):
         """Test calculating performance metrics."""
-        # Mock trading results
-        trades = [
-            {"entry": 100, "exit": 105, "profit": 5},
-            {"entry": 105, "exit": 103, "profit": -2},
-            {"entry": 103, "exit": 108, "profit": 5},
-        ]
+        # Mock trading results, stored one column per field so each metric
+        # reduces over a single sequence
+        trades = {
+            "entry": (100, 105, 103),
+            "exit": (105, 103, 108),
+            "profit": (5, -2, 5),
+        }
 
-        total_profit = sum(trade["profit"] for trade in trades)
-        win_rate = len([t for t in trades if t["profit"] > 0]) / len(trades)
+        profits = trades["profit"]
+        total_profit = sum(profits)
+        win_rate = sum(profit > 0 for profit in profits) / len(profits)
 
         assert total_profit == 8
         assert win_rate == 2 / 3
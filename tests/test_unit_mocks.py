@@ -3,49 +3,209 @@ Unit tests with mocked responses to avoid API dependencies.
 These tests can run without credentials and won't make real API calls.
 """
 
+import re
+import string
 from unittest.mock import Mock, patch
 
 import pytest
+import requests
+import responses
+from responses import matchers
 
 import robin_stocks.gemini as gem
+import robin_stocks.gemini.helper as gem_helper
 import robin_stocks.robinhood as rh
 import robin_stocks.tda as tda
+from robin_stocks.gemini.urls import URLS as GeminiURLS, Version as GeminiVersion
+from robin_stocks.tda.urls import URLS as TDAURLS
+
+# UUID-like device token: lowercase hex in 8-4-4-4-12 groups
+_TOKEN_RE = re.compile(r"[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}")
+
+# Deletes every character allowed in a ticker, so only invalid ones are left
+_NON_SYMBOL = str.maketrans("", "", string.ascii_uppercase + string.digits)
+
+
+def _symbols(symbols):
+    return [matchers.query_param_matcher({"symbols": symbols})]
+
+
+@pytest.fixture
+def robinhood_api():
+    """Stub the Robinhood HTTP endpoints for one test."""
+    quotes_url = rh.urls.quotes_url()
+    with responses.RequestsMock(assert_all_requests_are_fired=False) as api:
+        api.get(
+            quotes_url,
+            match=_symbols("AAPL"),
+            json={
+                "results": [
+                    {
+                        "symbol": "AAPL",
+                        "last_trade_price": "150.25",
+                        "last_extended_hours_trade_price": None,
+                    }
+                ]
+            },
+        )
+        api.get(quotes_url, match=_symbols("INVALID"), status=404)
+        api.get(quotes_url, match=_symbols("INVALID_SYMBOL"), status=404)
+        api.get(quotes_url, match=_symbols("BUSY"), status=504)
+        api.get(
+            quotes_url,
+            match=_symbols("SLOW"),
+            body=requests.exceptions.ConnectTimeout("Connection timeout"),
+        )
+        api.get(
+            rh.urls.fundamentals_url(),
+            match=_symbols("AAPL"),
+            json={
+                "results": [
+                    {
+                        "market_cap": "2500000000000",
+                        "pe_ratio": "25.5",
+                        "dividend_yield": "0.5",
+                    }
+                ]
+            },
+        )
+        yield api
+
+
+@pytest.fixture
+def robinhood_calls(robinhood_api):
+    """Requests made to the stubbed Robinhood API during one test."""
+    return robinhood_api.calls
 
 
 class TestRobinhoodMocked:
     """Test Robinhood functions with mocked API responses."""
 
-    @patch("robin_stocks.robinhood.helper.request_get")
-    def test_get_latest_price_success(self, mock_request):
+    def test_get_latest_price_success(self, robinhood_calls):
         """Test getting latest price with mocked response."""
-        mock_request.return_value = [{"price": "150.25"}]
-
         result = rh.get_latest_price("AAPL")
 
         assert result == ["150.25"]
-        mock_request.assert_called_once()
+        assert len(robinhood_calls) == 1
 
-    @patch("robin_stocks.robinhood.helper.request_get")
-    def test_get_latest_price_failure(self, mock_request):
+    def test_get_latest_price_failure(self, robinhood_api):
         """Test handling API failures gracefully."""
-        mock_request.return_value = None
-
         result = rh.get_latest_price("INVALID")
 
-        assert result is None
+        assert result == [None]
 
-    @patch("robin_stocks.robinhood.helper.request_get")
-    def test_get_fundamentals(self, mock_request):
+    def test_get_fundamentals(self, robinhood_api):
         """Test getting stock fundamentals."""
-        mock_request.return_value = [
-            {"market_cap": "2500000000000", "pe_ratio": "25.5", "dividend_yield": "0.5"}
-        ]
-
         result = rh.get_fundamentals("AAPL")
 
         assert result[0]["market_cap"] == "2500000000000"
         assert float(result[0]["pe_ratio"]) == 25.5
 
+    @patch("robin_stocks.robinhood.helper.request_get")
+    def test_id_for_stock_cached(self, mock_request, monkeypatch):
+        """Test that instrument ids are only looked up once per symbol."""
+        mock_request.return_value = {"id": "450dfc6d-5510-4d40-abfb-f633b7d9be3e"}
+        monkeypatch.setattr(rh.helper, "SYMBOL_TO_STOCK_ID_CACHE", {})
+
+        first = rh.helper.id_for_stock("aapl")
+        second = rh.helper.id_for_stock("AAPL")
+
+        assert first == second == "450dfc6d-5510-4d40-abfb-f633b7d9be3e"
+        mock_request.assert_called_once()
+
+    @patch("robin_stocks.robinhood.helper.LOGGED_IN", True)
+    @patch("robin_stocks.robinhood.crypto.get_crypto_id")
+    @patch("robin_stocks.robinhood.crypto.request_get")
+    def test_get_crypto_quotes_batched(self, mock_request, mock_id):
+        """Test that several crypto quotes come from a single request."""
+        mock_id.side_effect = lambda symbol: f"{symbol.lower()}-id"
+        mock_request.return_value = [
+            {"id": "btc-id", "symbol": "BTCUSD", "bid_price": "45000.00"},
+            {"id": "eth-id", "symbol": "ETHUSD", "bid_price": "3000.00"},
+        ]
+
+        result = rh.get_crypto_quotes(["btc", "ETH"], info="bid_price")
+
+        assert result == ["45000.00", "3000.00"]
+        mock_request.assert_called_once()
+        assert mock_request.call_args[0][2] == {"ids": "btc-id,eth-id"}
+
+
+class TestUrlBuilding:
+    """Test that endpoint urls are built and split correctly."""
+
+    def test_orders_url(self):
+        """Test that order query parameters are percent-encoded."""
+        url = rh.urls.orders_url(
+            account_number="a,b", start_date="2021-01-01T00:00:00Z"
+        )
+
+        assert url == (
+            "https://api.robinhood.com/orders/?account_numbers=a%2Cb"
+            "&updated_at[gte]=2021-01-01T00%3A00%3A00Z"
+        )
+        assert rh.urls.orders_url("abc") == "https://api.robinhood.com/orders/abc/"
+
+    def test_option_orders_url(self):
+        """Test that option order query parameters are percent-encoded."""
+        url = rh.urls.option_orders_url(
+            "abc", account_number="a,b", start_date="2021-01-01T00:00:00Z"
+        )
+
+        assert url == (
+            "https://api.robinhood.com/options/orders/abc/?account_numbers=a%2Cb"
+            "&updated_at[gte]=2021-01-01T00%3A00%3A00Z"
+        )
+        assert (
+            rh.urls.option_orders_url() == "https://api.robinhood.com/options/orders/"
+        )
+
+    @pytest.mark.parametrize("sandbox", [False, True])
+    def test_gemini_get_endpoint(self, sandbox, monkeypatch):
+        """Test that the endpoint is split off both the live and sandbox base."""
+        monkeypatch.setattr(gem_helper, "USE_SANDBOX_URLS", sandbox)
+        url = GeminiURLS.get_base_url(GeminiVersion.v1) + "balances"
+
+        assert ("sandbox" in url) is sandbox
+        assert GeminiURLS.get_endpoint(url) == "/v1/balances"
+        assert GeminiURLS.get_endpoint(url.upper()) == "/V1/BALANCES"
+
+    def test_tda_get_endpoint(self):
+        """Test that the endpoint is split off the base case-insensitively."""
+        assert TDAURLS.get_endpoint(TDAURLS.accounts()) == "/v1/accounts"
+        assert (
+            TDAURLS.get_endpoint("HTTPS://API.TDAmeritrade.com/v1/accounts")
+            == "/v1/accounts"
+        )
+
+    @pytest.mark.parametrize(
+        "get_endpoint", [GeminiURLS.get_endpoint, TDAURLS.get_endpoint]
+    )
+    def test_get_endpoint_wrong_base(self, get_endpoint):
+        """Test that urls from another host are rejected."""
+        with pytest.raises(ValueError):
+            get_endpoint("https://api.example.com/v1/accounts")
+
+
+class TestResponseParsing:
+    """Test parsing of API response bodies."""
+
+    @pytest.mark.parametrize("parser", ["orjson", "json"])
+    def test_parse_json(self, parser, monkeypatch):
+        """Test that response bodies parse the same with or without orjson."""
+        if parser == "orjson":
+            monkeypatch.setattr(rh.helper, "orjson", pytest.importorskip("orjson"))
+        else:
+            monkeypatch.setattr(rh.helper, "orjson", None)
+        response = requests.Response()
+        response.status_code = 200
+        response.encoding = "utf-8"
+        response._content = b'{"results": [{"price": "150.25"}], "next": null}'
+
+        result = rh.helper.parse_json(response)
+
+        assert result == {"results": [{"price": "150.25"}], "next": None}
+
 
 class TestGeminiMocked:
     """Test Gemini functions with mocked API responses."""
@@ -105,19 +265,20 @@ class TestTDAMocked:
 class TestErrorHandling:
     """Test error handling across all APIs."""
 
-    def test_robinhood_invalid_symbol(self):
+    def test_robinhood_invalid_symbol(self, robinhood_api):
         """Test handling of invalid stock symbols."""
-        with patch("robin_stocks.robinhood.helper.request_get") as mock_request:
-            mock_request.return_value = None
-            result = rh.get_latest_price("INVALID_SYMBOL")
-            assert result is None
+        result = rh.get_latest_price("INVALID_SYMBOL")
+        assert result == [None]
 
-    def test_network_timeout_handling(self):
-        """Test handling of network timeouts."""
-        with patch("robin_stocks.robinhood.helper.request_get") as mock_request:
-            mock_request.side_effect = Exception("Connection timeout")
-            result = rh.get_latest_price("AAPL")
-            assert result is None
+    def test_gateway_timeout_handling(self, robinhood_api):
+        """Test that a gateway timeout is reported as a missing price."""
+        result = rh.get_latest_price("BUSY")
+        assert result == [None]
+
+    def test_network_timeout_handling(self, robinhood_api):
+        """Test that a connection timeout reaches the caller."""
+        with pytest.raises(requests.exceptions.Timeout):
+            rh.get_latest_price("SLOW")
 
 
 class TestConfigValidation:
@@ -125,15 +286,9 @@ class TestConfigValidation:
 
     def test_device_token_generation(self):
         """Test that device tokens are properly formatted."""
-        token = rh.generate_device_token()
-
-        # Should be UUID-like format with dashes
-        assert len(token) == 36
-        assert token.count("-") == 4
+        token = rh.authentication.generate_device_token()
 
-        # Should be hexadecimal characters
-        clean_token = token.replace("-", "")
-        assert all(c in "0123456789abcdef" for c in clean_token)
+        assert _TOKEN_RE.fullmatch(token)
 
     def test_session_state_management(self):
         """Test session state tracking."""
@@ -148,32 +303,26 @@ class TestConfigValidation:
 class TestDataValidation:
     """Test data validation and sanitization."""
 
-    def test_price_formatting(self):
+    def test_price_formatting(self, robinhood_api):
         """Test that price data is properly formatted."""
-        with patch("robin_stocks.robinhood.helper.request_get") as mock_request:
-            mock_request.return_value = [{"price": "150.2567"}]
-
-            result = rh.get_latest_price("AAPL")
-            price = float(result[0])
+        result = rh.get_latest_price("AAPL")
+        price = float(result[0])
 
-            # Should be a valid number
-            assert isinstance(price, float)
-            assert price > 0
+        # Should be a valid number
+        assert isinstance(price, float)
+        assert price > 0
 
     def test_symbol_validation(self):
         """Test that stock symbols are validated."""
         # Test valid symbols
         valid_symbols = ["AAPL", "TSLA", "SPY", "QQQ"]
         for symbol in valid_symbols:
-            assert symbol.isalpha() or symbol.isalnum()
-            assert len(symbol) <= 5
+            assert len(symbol) <= 5 and not symbol.upper().translate(_NON_SYMBOL)
 
-    @pytest.mark.parametrize(
-        "symbol,expected", [("aapl", "AAPL"), ("Tsla", "TSLA"), ("spy", "SPY")]
-    )
-    def test_symbol_normalization(self, symbol, expected):
+    def test_symbol_normalization(self):
         """Test that symbols are normalized to uppercase."""
-        normalized = symbol.upper()
+        expected = {"aapl": "AAPL", "Tsla": "TSLA", "spy": "SPY"}
+        normalized = {symbol: symbol.upper() for symbol in expected}
         assert normalized == expected
 
 